@@ -1,27 +1,18 @@
 #!/usr/bin/env python3
-import sys
-import os
-# Add the project root directory to Python's path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
+import asyncio
 import time
-from logging_setup import logger
+from logging_setup import logger, configure_logging
 import os
 from typing import List, Tuple, Optional, Dict, Any
-import threading
 from led_control.led_management import LED, LEDMatrix
 from led_control.led_visualizer import LEDVisualizer
-from constants import DEFAULT_COLS, DEFAULT_ROWS
+from constants import DEFAULT_COLS, DEFAULT_ROWS, TIME_UNIT, ON_HARDWARE
 
 
 # Determine if we're running on actual hardware
-try:
-    # Try to import RPi.GPIO as a test
-    import RPi.GPIO as GPIO
-    ON_HARDWARE = True
+if ON_HARDWARE:
     logger.info("Running on actual Raspberry Pi hardware")
-except (ImportError, RuntimeError):  
-    ON_HARDWARE = False
+else:
     logger.info("Running in development mode with mock hardware")
 
 # Import the appropriate hardware module
@@ -30,29 +21,49 @@ if ON_HARDWARE:
 else:
     from hardware.mock_hardware import get_controllers
 
-def run_demo_sequence(matrix: LEDMatrix):
-    """Run the LED demo sequence"""
+async def sleep_until(deadline: float):
+    """Sleep until a time.monotonic() deadline, returning immediately if it has passed"""
+    await asyncio.sleep(max(0, deadline - time.monotonic()))
+
+async def run_demo_sequence(matrix: LEDMatrix, step_units: int = 10):
+    """
+    Run the LED demo sequence
+    
+    Args:
+        matrix: The LED matrix to drive
+        step_units: How long to hold each step (in time units)
+    """
     # Turn all LEDs off
     matrix.all_off()
     
-    # Blink each LED in sequence
+    # Blink each LED in sequence (runs on the scheduler thread; wait for it to finish)
     print("Blinking each LED in sequence...")
-    matrix.blink_sequence(delay=1)  # .1 second delay (1 time unit)
+    await sleep_until(matrix.blink_sequence(delay=1))  # .1 second delay (1 time unit)
     
     # Turn on all LEDs in the first row
     print("Turning on first row...")
+    next_tick = time.monotonic() + TIME_UNIT * step_units
     matrix.set_row(0)
-    time.sleep(1)
+    await sleep_until(next_tick)
     
     # Turn on all LEDs in the first column
     print("Turning on first column...")
+    next_tick += TIME_UNIT * step_units
     matrix.all_off()
     matrix.set_column(0)
-    time.sleep(1)
+    await sleep_until(next_tick)
     
     # Turn all LEDs off
     matrix.all_off()
 
+def pump_event_loop(root, loop: asyncio.AbstractEventLoop, interval_ms: int = 10):
+    """Run an asyncio loop's ready callbacks from inside the Tk mainloop"""
+    def pump():
+        loop.call_soon(loop.stop)
+        loop.run_forever()
+        root.after(interval_ms, pump)
+    root.after(interval_ms, pump)
+
 def main():
     logger.info("Initializing controllers...")
     controllers = get_controllers()
@@ -62,19 +73,26 @@ def main():
         return
     
     # Create a 6x9 LED matrix (54 LEDs total)
-    matrix = LEDMatrix(DEFAULT_COLS, DEFAULT_ROWS, controllers)
+    matrix = LEDMatrix(DEFAULT_COLS, DEFAULT_ROWS, controllers, io_thread=True)
     
     # Create and start the visualizer
     visualizer = LEDVisualizer(matrix)
     
-    # Run the demo sequence in a separate thread
-    demo_thread = threading.Thread(target=run_demo_sequence, args=(matrix,), daemon=True)
-    demo_thread.start()
+    # Run the demo sequence as a coroutine on an event loop pumped by Tk
+    loop = asyncio.new_event_loop()
+    demo = loop.create_task(run_demo_sequence(matrix))
+    pump_event_loop(visualizer.root, loop)
     
     # Run the visualizer (this will block until window is closed)
-    visualizer.run()
+    try:
+        visualizer.run()
+    finally:
+        demo.cancel()
+        loop.run_until_complete(asyncio.gather(demo, return_exceptions=True))
+        loop.close()
 
 if __name__ == "__main__":
+    configure_logging()
     try:
         main()
     except KeyboardInterrupt:
@@ -1,5 +1,6 @@
 # constants.py
 """Constants used throughout the project."""
+import importlib.util
 
 # Time constants
 TIME_UNIT = 0.1  # Each time unit is 0.1 seconds
@@ -14,4 +15,11 @@ PCA9685_ADDRESSES = [0x40, 0x41, 0x42, 0x43]
 
 # LED Matrix configuration
 DEFAULT_ROWS = 6
-DEFAULT_COLS = 9
\ No newline at end of file
+DEFAULT_COLS = 9
+
+# Hardware detection: RPi.GPIO is only installed on the Raspberry Pi.
+# A spec lookup avoids paying for a full (failing) import on dev machines.
+try:
+    ON_HARDWARE = importlib.util.find_spec("RPi.GPIO") is not None
+except ModuleNotFoundError:
+    ON_HARDWARE = False
@@ -3,30 +3,72 @@ import logging
 import tkinter as tk
 from tkinter import ttk
 import threading
+import weakref
+from array import array
 from constants import PCA9685_ADDRESSES, CHANNELS_PER_CONTROLLER
 
 logger = logging.getLogger(__name__)
 
+# Grayscale colors indexed by 8-bit level, built once instead of per redraw
+_PALETTE = tuple(f"#{i:02x}{i:02x}{i:02x}" for i in range(256))
+
+# Visualization redraw period (~60Hz)
+REDRAW_INTERVAL_MS = 16
+
+# LEDs per row in the visualization grid
+GRID_COLUMNS = 4
+
+# Named ttk label styles for 32 brightness buckets (duty cycle >> 11), so a
+# redraw only swaps the style instead of re-parsing a color option
+_OFF_STYLE = "LEDOff.TLabel"
+_LEVEL_STYLES = tuple(f"LED{level}.TLabel" for level in range(32))
+
 class MockPWMChannel:
-    def __init__(self, channel_num, controller_address):
+    """View of one channel in a controller's duty cycle buffer"""
+    
+    def __init__(self, channel_num, controller_address, duties=None):
         self.channel_num = channel_num
         self.controller_address = controller_address
-        self._duty_cycle = 0
+        # Standalone channels get their own single-slot buffer
+        if duties is None:
+            self._duties, self._index = array('H', [0]), 0
+        else:
+            self._duties, self._index = duties, channel_num
     
     @property
     def duty_cycle(self):
-        return self._duty_cycle
+        return self._duties[self._index]
     
     @duty_cycle.setter
     def duty_cycle(self, value):
-        self._duty_cycle = value
-        state = "ON" if value > 0 else "OFF"
-        logger.info(f"LED on controller 0x{self.controller_address:02x}, channel {self.channel_num} set to {state}")
+        self._duties[self._index] = value
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("LED on controller 0x%02x, channel %d set to %s",
+                        self.controller_address, self.channel_num, "ON" if value > 0 else "OFF")
+
+class _LazyChannelView:
+    """Sequence of channel proxies created on access instead of held per controller"""
+    
+    def __init__(self, controller):
+        self._controller = controller
+    
+    def __len__(self):
+        return len(self._controller.duties)
+    
+    def __getitem__(self, channel):
+        if not 0 <= channel < len(self._controller.duties):
+            raise IndexError(f"Channel {channel} out of range")
+        return MockPWMChannel(channel, self._controller.address, self._controller.duties)
+    
+    def __iter__(self):
+        for channel in range(len(self)):
+            yield self[channel]
 
 class MockPCA9685:
     def __init__(self, i2c=None, address=0x40):
         self.address = address
-        self.channels = [MockPWMChannel(i, address) for i in range(CHANNELS_PER_CONTROLLER)]
+        self.duties = array('H', [0] * CHANNELS_PER_CONTROLLER)
+        self.channels = _LazyChannelView(self)
         self._frequency = 60
     
     @property
@@ -51,19 +93,127 @@ class HardwareSystem:
         
         for address in addresses:
             controllers.append(MockPCA9685(address=address))
-            logger.info(f"Mock PCA9685 at address 0x{address:02x} initialized")
         
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Mock PCA9685 controllers initialized: %s",
+                        ", ".join(f"0x{address:02x}" for address in addresses))
         return controllers
     
     def get_controllers(self):
         """Get all controllers in the system"""
         return self.controllers
 
+# Shared hardware system, created on first use
+_SYSTEM = None
+
 # For backward compatibility
 def get_controllers():
     """Legacy function to get all controllers"""
-    system = HardwareSystem()
-    return system.get_controllers()
+    global _SYSTEM
+    if _SYSTEM is None:
+        _SYSTEM = HardwareSystem()
+    return _SYSTEM.get_controllers()
+
+class _Visualization:
+    """
+    Tk window showing one controller's channels, run on its own thread
+    
+    Holds only the duty cycle buffer it draws, never the MockHardware that owns
+    it, so the hardware can be collected while the window is open and its
+    finalizer can close the window.
+    """
+    
+    def __init__(self, duties: array):
+        self.duties = duties
+        self.root = None
+        self.led_frames = []
+        # Channels written since the last redraw, drained on the Tk thread
+        self.dirty = set()
+        self.dirty_lock = threading.Lock()
+        self.closed = threading.Event()
+    
+    def run(self):
+        """Build the window and run its event loop (the Tk thread's target)"""
+        self.root = tk.Tk()
+        # close() may have run before the window existed
+        if self.closed.is_set():
+            self.root.destroy()
+            return
+        self.root.title("LED Matrix Visualization")
+        
+        # Create one style per brightness bucket
+        style = ttk.Style(self.root)
+        style.configure(_OFF_STYLE, foreground="gray")
+        for level, name in enumerate(_LEVEL_STYLES):
+            style.configure(name, foreground=_PALETTE[level << 3 | 7])
+        
+        # Create main frame
+        main_frame = ttk.Frame(self.root, padding="10")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Create one LED frame per channel, GRID_COLUMNS to a row
+        num_leds = len(self.duties)
+        grid_rows = -(-num_leds // GRID_COLUMNS)
+        main_frame.grid_columnconfigure(tuple(range(GRID_COLUMNS)), uniform="led")
+        main_frame.grid_rowconfigure(tuple(range(grid_rows)), uniform="led")
+        for idx in range(num_leds):
+            i, j = divmod(idx, GRID_COLUMNS)
+            frame = ttk.Frame(main_frame, width=50, height=50, relief="solid", borderwidth=1)
+            frame.grid(row=i, column=j, padx=2, pady=2)
+            
+            # Create LED indicator (placed, so the frame keeps its fixed size)
+            led = ttk.Label(frame, text="●", font=("Arial", 24), style=_OFF_STYLE)
+            led.place(relx=0.5, rely=0.5, anchor="center")
+            
+            self.led_frames.append((frame, led))
+        
+        # Repaint at a fixed ~60Hz no matter how fast channels are written
+        def tick():
+            self.flush_dirty()
+            self.root.after(REDRAW_INTERVAL_MS, tick)
+        self.root.after(REDRAW_INTERVAL_MS, tick)
+        
+        # Start the Tkinter event loop
+        self.root.mainloop()
+        self.root.destroy()
+    
+    def mark_dirty(self, channel: int):
+        """Queue a channel for the next redraw tick"""
+        with self.dirty_lock:
+            self.dirty.add(channel)
+    
+    def flush_dirty(self):
+        """Repaint every channel written since the last redraw (runs on the Tk thread)"""
+        with self.dirty_lock:
+            dirty, self.dirty = self.dirty, set()
+        for channel in dirty:
+            self.update(channel, self.duties[channel])
+    
+    def update(self, channel: int, value: int):
+        """Update the LED visualization"""
+        if not self.root or channel >= len(self.led_frames):
+            return
+            
+        # Update LED color based on brightness
+        frame, led = self.led_frames[channel]
+        if value > 0:
+            # Convert duty cycle to color (gray to white)
+            led.configure(style=_LEVEL_STYLES[value >> 11])
+        else:
+            led.configure(style=_OFF_STYLE)
+    
+    def close(self):
+        """Ask the Tk thread to leave its event loop; it destroys the window itself"""
+        # Set before reading root, so a window created after the read sees the flag
+        self.closed.set()
+        root = self.root
+        if root is None:
+            return
+        try:
+            root.after(0, root.quit)
+        except (RuntimeError, tk.TclError):
+            # Tk has already shut down
+            pass
 
 class MockHardware:
     """Mock hardware controller with Tkinter visualization"""
@@ -72,39 +222,15 @@ class MockHardware:
         """Initialize the mock hardware with a single controller"""
         self.controller = MockPCA9685()
         self.channels = self.controller.channels
-        self._root = None
-        self._led_frames = []
+        self._viz = _Visualization(self.controller.duties)
+        # Closes the window on close(), when this object is collected, or at exit
+        self._finalizer = weakref.finalize(self, self._viz.close)
         self._start_visualization()
     
     def _start_visualization(self):
         """Start the Tkinter visualization in a separate thread"""
-        def run_visualization():
-            self._root = tk.Tk()
-            self._root.title("LED Matrix Visualization")
-            
-            # Create main frame
-            main_frame = ttk.Frame(self._root, padding="10")
-            main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-            
-            # Create LED frames in a grid
-            for i in range(4):  # 4x4 grid
-                for j in range(4):
-                    frame = ttk.Frame(main_frame, width=50, height=50, relief="solid", borderwidth=1)
-                    frame.grid(row=i, column=j, padx=2, pady=2)
-                    frame.grid_propagate(False)
-                    
-                    # Create LED indicator
-                    led = ttk.Label(frame, text="●", font=("Arial", 24))
-                    led.place(relx=0.5, rely=0.5, anchor="center")
-                    led.configure(foreground="gray")
-                    
-                    self._led_frames.append((frame, led))
-            
-            # Start the Tkinter event loop
-            self._root.mainloop()
-        
-        # Start visualization in a separate thread
-        self._viz_thread = threading.Thread(target=run_visualization, daemon=True)
+        # The thread holds only the window state, so it doesn't keep self alive
+        self._viz_thread = threading.Thread(target=self._viz.run, daemon=True)
         self._viz_thread.start()
     
     def set_channel(self, channel: int, value: int):
@@ -116,8 +242,10 @@ class MockHardware:
             value: Duty cycle value (0-65535)
         """
         if 0 <= channel < len(self.channels):
+            if self.channels[channel].duty_cycle == value:
+                return
             self.channels[channel].duty_cycle = value
-            self._update_visualization(channel, value)
+            self._viz.mark_dirty(channel)
         else:
             logger.error(f"Invalid channel number: {channel}")
     
@@ -137,28 +265,6 @@ class MockHardware:
             logger.error(f"Invalid channel number: {channel}")
             return 0
     
-    def _update_visualization(self, channel: int, value: int):
-        """Update the LED visualization"""
-        if not self._root or channel >= len(self._led_frames):
-            return
-            
-        # Convert duty cycle to brightness (0-1)
-        brightness = value / 65535.0
-        
-        # Update LED color based on brightness
-        frame, led = self._led_frames[channel]
-        if brightness > 0:
-            # Convert brightness to color (gray to white)
-            color = f"#{int(brightness * 255):02x}{int(brightness * 255):02x}{int(brightness * 255):02x}"
-            led.configure(foreground=color)
-        else:
-            led.configure(foreground="gray")
-        
-        # Update the display
-        self._root.update_idletasks()
-    
-    def __del__(self):
-        """Clean up when the object is destroyed"""
-        if self._root:
-            self._root.quit()
-            self._root.destroy()
\ No newline at end of file
+    def close(self):
+        """Close the visualization window"""
+        self._finalizer()
\ No newline at end of file
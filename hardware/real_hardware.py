@@ -1,19 +1,164 @@
 # hardware/real_hardware.py
+from functools import lru_cache
+import struct
+import threading
+import time
 import board
 import busio
 from adafruit_pca9685 import PCA9685
-from constants import PCA9685_ADDRESSES
+from constants import PCA9685_ADDRESSES, CHANNELS_PER_CONTROLLER
 
+# PCA9685 register map
+MODE1 = 0x00
+LED0_ON_L = 0x06
+PRESCALE = 0xFE
+REGISTERS_PER_CHANNEL = 4  # ON_L, ON_H, OFF_L, OFF_H
+
+# MODE1 bits
+MODE1_RESTART = 0x80
+MODE1_AI = 0x20  # Register auto-increment
+MODE1_SLEEP = 0x10
+
+PWM_FREQUENCY = 60
+
+# Little-endian ON and OFF counts for one channel
+_CHANNEL_REGS = struct.Struct('<HH')
+
+
+def configure_frequency(pca: PCA9685, frequency: int = PWM_FREQUENCY):
+    """
+    Program the PWM frequency and enable auto-increment in one locked bus session
+
+    The library's frequency setter reads MODE1 back and waits 5ms. After the
+    reset done in PCA9685.__init__ MODE1 is known to be 0, so the registers
+    can be written directly, waiting only the 500us oscillator start-up the
+    datasheet requires before RESTART.
+    """
+    prescale = int(pca.reference_clock_speed / 4096.0 / frequency + 0.5)
+    if prescale < 3:
+        raise ValueError("PCA9685 cannot output at the given frequency")
+
+    with pca.i2c_device as i2c:
+        i2c.write(bytes([MODE1, MODE1_SLEEP]))
+        i2c.write(bytes([PRESCALE, prescale]))
+        i2c.write(bytes([MODE1, MODE1_AI]))
+        time.sleep(0.0005)
+        i2c.write(bytes([MODE1, MODE1_RESTART | MODE1_AI]))
+
+
+class BatchedChannel:
+    """Channel proxy that writes into the owning controller's shadow registers"""
+
+    def __init__(self, controller, channel_num):
+        self._controller = controller
+        self.channel_num = channel_num
+
+    @property
+    def duty_cycle(self):
+        return self._controller.get_channel(self.channel_num)
+
+    @duty_cycle.setter
+    def duty_cycle(self, value):
+        self._controller.set_channel(self.channel_num, value)
+
+
+class BatchedPCA9685:
+    """
+    PCA9685 wrapper that batches channel writes into a single I2C transaction.
+
+    Channel writes only update a shadow copy of the LED0_ON_L..LED15_OFF_H
+    registers; flush() sends the span of changed channels in one
+    auto-increment burst.
+    """
+
+    def __init__(self, pca: PCA9685):
+        self._pca = pca
+        self.address = pca.i2c_device.device_address
+        self._shadow = bytearray(CHANNELS_PER_CONTROLLER * REGISTERS_PER_CHANNEL)
+        self._shadow_view = memoryview(self._shadow)
+        # Reused I2C payload: start register followed by the register span
+        self._payload = bytearray(1 + len(self._shadow))
+        self._duty = [0] * CHANNELS_PER_CONTROLLER
+        # Bit n is set while channel n has unsent changes. Writers and flushes run on
+        # several threads, so the mask and shadow registers are only touched under this lock
+        self._pending = 0
+        self._lock = threading.Lock()
+        # Serializes whole flushes, so snapshots reach the chip in the order they were taken
+        self._flush_lock = threading.Lock()
+        self.channels = [BatchedChannel(self, i) for i in range(CHANNELS_PER_CONTROLLER)]
+
+    @property
+    def frequency(self):
+        return self._pca.frequency
+
+    @frequency.setter
+    def frequency(self, value):
+        self._pca.frequency = value
+
+    def get_channel(self, channel: int) -> int:
+        """Get the last duty cycle written to a channel (0-65535)"""
+        return self._duty[channel]
+
+    def set_channel(self, channel: int, value: int):
+        """
+        Set a channel's duty cycle in the shadow registers
+
+        Args:
+            channel: Channel number (0-15)
+            value: Duty cycle value (0-65535)
+        """
+        # Checked up front like the adafruit duty_cycle setter: an out-of-range value
+        # would pack into the wrong register bits (bit 12 of OFF is the full-off flag)
+        if not 0 <= channel < CHANNELS_PER_CONTROLLER:
+            raise IndexError(f"Channel {channel} out of range")
+        if not 0 <= value <= 0xFFFF:
+            raise ValueError(f"Out of range: value {value} not 0 <= value <= 65,535")
+        if value == 0xFFFF:
+            on, off = 0x1000, 0  # Full on
+        else:
+            on, off = 0, (value + 1) >> 4
+        with self._lock:
+            _CHANNEL_REGS.pack_into(self._shadow, channel * REGISTERS_PER_CHANNEL, on, off)
+            self._duty[channel] = value
+            self._pending |= 1 << channel
+
+    def flush(self):
+        """Write the channels changed since the last flush in a single transaction"""
+        with self._flush_lock:
+            # Take and clear the mask and copy the registers atomically, so a write that
+            # lands mid-flush keeps its bit and is sent by the next flush
+            with self._lock:
+                pending = self._pending
+                if not pending:
+                    return
+                self._pending = 0
+
+                # Send the contiguous register span from the lowest to the highest changed channel
+                first = (pending & -pending).bit_length() - 1
+                last = pending.bit_length()
+                start = first * REGISTERS_PER_CHANNEL
+                end = last * REGISTERS_PER_CHANNEL
+                payload = self._payload
+                payload[0] = LED0_ON_L + start
+                payload[1:1 + end - start] = self._shadow_view[start:end]
+            # The I2C burst runs outside the lock so channel writes don't wait on the bus
+            with self._pca.i2c_device as i2c:
+                i2c.write(payload, end=1 + end - start)
+
+
+@lru_cache(maxsize=1)
 def get_controllers():
+    # Cached so the I2C bus is opened and the controllers configured once per process
     i2c = busio.I2C(board.SCL, board.SDA)
     controllers = []
-    
+
     for address in PCA9685_ADDRESSES:
         try:
             pca = PCA9685(i2c, address=address)
-            pca.frequency = 60
-            controllers.append(pca)
+            # Also enables register auto-increment, which the batched block writes rely on
+            configure_frequency(pca)
+            controllers.append(BatchedPCA9685(pca))
         except Exception as e:
             print(f"Failed to initialize PCA9685 at address 0x{address:02x}: {e}")
-    
-    return controllers
\ No newline at end of file
+
+    return controllers
@@ -1,9 +1,81 @@
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Callable, Iterable, Sequence, Union
+from array import array
+from collections import defaultdict
+from functools import partial
+import heapq
+import itertools
+import logging
+import queue
 import time
 from logging_setup import logger
-from constants import TIME_UNIT
+from constants import TIME_UNIT, CHANNELS_PER_CONTROLLER
 import threading
 
+# Maximum flush requests the I/O thread drains before writing, bounding latency
+IO_BATCH_LIMIT = 8
+
+# Completed ScheduledTask objects kept per matrix for reuse
+TASK_POOL_SIZE = 16
+
+# Brightness levels (0-100) for a fade in and back out, built once as one byte per step
+FADE_STEPS = 20
+_FADE_UP = bytes(100 * i // (FADE_STEPS // 2 - 1) for i in range(FADE_STEPS // 2))
+FADE_CURVE = _FADE_UP + _FADE_UP[::-1]
+
+# 16-bit PCA9685 duty cycle for each brightness level 0-100, built once so
+# brightness updates index a table instead of doing float math
+_DUTY_LUT = tuple(level * 0xFFFF // 100 for level in range(101))
+
+# Maps a byte 0-255 to that brightness level clamped to 100, for bytes.translate
+_CLAMP_TABLE = bytes(min(level, 100) for level in range(256))
+
+# Brightness clamped to 0-100, indexed by value + _SATURATE_OFFSET for any int
+# in [-256, 356], so the common case is one index instead of max()/min()
+_SATURATE_OFFSET = 256
+_SATURATE = bytes(_SATURATE_OFFSET) + bytes(range(101)) + bytes([100]) * 256
+
+
+def _fraction_to_level(brightness: Union[int, float]) -> int:
+    """Convert a 0.0-1.0 brightness (ints 0 and 1 included) to a clamped 0-100 level"""
+    if brightness >= 1:
+        return 100
+    if brightness <= 0:
+        return 0
+    return int(brightness * 100)
+
+
+def _clamp_level(value: Union[int, float]) -> int:
+    """Clamp one brightness value to an int level 0-100; floats are truncated"""
+    return max(0, min(100, int(value)))
+
+
+def _clamp_levels(values: List[int]) -> array:
+    """Clamp brightness values to 0-100 as an array('B'); floats are truncated"""
+    try:
+        # Ints in 0-255 convert and clamp entirely in C
+        return array('B', bytes(values).translate(_CLAMP_TABLE))
+    except (TypeError, ValueError):
+        return array('B', [_clamp_level(value) for value in values])
+
+
+def _compute_addr(row: int, col: int, cols: int) -> Tuple[int, int]:
+    """Map a matrix position to its (controller index, channel) pair"""
+    return divmod(row * cols + col, CHANNELS_PER_CONTROLLER)
+
+
+def flush_controller(controller):
+    """Send pending channel writes for controllers that batch them"""
+    flush = getattr(controller, "flush", None)
+    if flush:
+        flush()
+
+
+def flush_leds(leds: List["LED"]):
+    """Flush each distinct controller driving the given LEDs once"""
+    for controller in {id(led.controller): led.controller for led in leds}.values():
+        flush_controller(controller)
+
+
 class LED:
     """Base LED class that represents a single LED"""
     
@@ -19,13 +91,27 @@ class LED:
         self.led_id = led_id
         self.controller = controller
         self.channel = channel
-        self._brightness = 0  # 0-100 scale
-        logger.debug(f"LED {led_id} initialized on channel {channel}")
+        # Resolve the channel proxy once so writes don't index the controller each time
+        self._channel_obj = controller.channels[channel] if controller is not None else None
+        # Brightness (0-100 scale) and 16-bit duty cycle are stored in buffers
+        # that an LEDMatrix can share, making this object a view onto one slot
+        self._levels = array('B', [0])
+        self._duties = array('H', [0])
+        self._index = 0
+        logger.debug("LED %d initialized on channel %d", led_id, channel)
+    
+    def _bind(self, levels: array, duties: array, index: int):
+        """Store this LED's state in slot `index` of shared brightness/duty buffers"""
+        levels[index] = self._levels[self._index]
+        duties[index] = self._duties[self._index]
+        self._levels = levels
+        self._duties = duties
+        self._index = index
     
     @property
     def brightness(self) -> int:
         """Get current brightness level (0-100)"""
-        return self._brightness
+        return self._levels[self._index]
     
     @brightness.setter
     def brightness(self, value: int):
@@ -35,23 +121,65 @@ class LED:
         Args:
             value: Brightness level from 0 (off) to 100 (full brightness)
         """
-        # Clamp value between 0 and 100
-        value = max(0, min(100, value))
-        self._brightness = value
+        self.set_brightness(value)
+    
+    @property
+    def duty_cycle(self) -> int:
+        """Get the 16-bit duty cycle last computed for this LED's brightness"""
+        return self._duties[self._index]
+    
+    def set_brightness(self, value: int, defer: bool = False):
+        """
+        Set brightness level (0-100)
         
+        Args:
+            value: Brightness level from 0 (off) to 100 (full brightness)
+            defer: If True, leave batched controllers unflushed so the caller
+                can send several channel updates in one transaction
+        """
+        # Clamp value between 0 and 100; float levels are truncated to ints first
+        if type(value) is not int:
+            value = int(value)
+        if -_SATURATE_OFFSET <= value < len(_SATURATE) - _SATURATE_OFFSET:
+            value = _SATURATE[value + _SATURATE_OFFSET]
+        else:
+            value = max(0, min(100, value))
+        self._levels[self._index] = value
+        # Convert 0-100 to 0-0xFFFF (16-bit value for PCA9685)
+        self._duties[self._index] = _DUTY_LUT[value]
+        self._push(defer)
+    
+    def _push(self, defer: bool = False):
+        """Write the stored duty cycle to the controller"""
         # If we have a controller, set the duty cycle
-        if self.controller:
-            # Convert 0-100 to 0-0xFFFF (16-bit value for PCA9685)
-            duty_cycle = int((value / 100.0) * 0xFFFF)
-            controller_idx = self.led_id // 16
-            channel_idx = self.led_id % 16
-            
+        if self._channel_obj is not None:
             try:
-                self.controller.channels[channel_idx].duty_cycle = duty_cycle
-                logger.debug(f"LED {self.led_id} brightness set to {value}%")
+                self._channel_obj.duty_cycle = self._duties[self._index]
+                if not defer:
+                    flush_controller(self.controller)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("LED %d brightness set to %d%%", self.led_id, self._levels[self._index])
             except Exception as e:
                 logger.error(f"Error setting brightness for LED {self.led_id}: {e}")
     
+    @classmethod
+    def set_many(cls, matrix: "LEDMatrix", indices: Union[slice, Iterable[int]], brightness: int):
+        """
+        Set several LEDs of a matrix to one brightness with a single flush
+        
+        Args:
+            matrix: Matrix that owns the LEDs
+            indices: Slice of LED indices (row-major) or iterable of LED IDs
+            brightness: Brightness level (0-100)
+        """
+        value = _clamp_level(brightness)
+        if isinstance(indices, slice):
+            count = len(range(len(matrix.leds))[indices])
+            matrix._write(indices, array('B', [value]) * count)
+        else:
+            matrix._write_ids(indices, itertools.repeat(value))
+        matrix._flush_dirty()
+    
     def on(self, brightness: int = 100):
         """Turn LED on at specified brightness"""
         self.brightness = brightness
@@ -68,35 +196,142 @@ class LED:
         return f"LED(id={self.led_id}, brightness={self.brightness})"
 
 
+class _Scheduler:
+    """Runs callbacks at time.monotonic() deadlines on a single background thread"""
+    
+    def __init__(self):
+        self._heap: List[Tuple[float, int, Callable[[], None]]] = []
+        self._cancelled = set()
+        # IDs still in the heap, so cancelling an entry that already ran leaves no tombstone
+        self._live = set()
+        self._cv = threading.Condition()
+        self._ids = itertools.count()
+        self._thread = None
+    
+    def schedule(self, deadline: float, callback: Callable[[], None]) -> int:
+        """
+        Run a callback at a deadline
+        
+        Args:
+            deadline: time.monotonic() value at which to run the callback
+            callback: Function to call with no arguments
+            
+        Returns:
+            entry_id: ID that can be passed to cancel()
+        """
+        with self._cv:
+            entry_id = next(self._ids)
+            heapq.heappush(self._heap, (deadline, entry_id, callback))
+            self._live.add(entry_id)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._cv.notify()
+        return entry_id
+    
+    def cancel(self, entry_id: int):
+        """Mark an entry so it is dropped instead of run when its deadline arrives"""
+        with self._cv:
+            if entry_id in self._live:
+                self._cancelled.add(entry_id)
+    
+    def _next_due(self) -> Callable[[], None]:
+        """Block until the earliest live entry is due, then pop and return its callback"""
+        with self._cv:
+            while True:
+                if not self._heap:
+                    self._cv.wait()
+                    continue
+                
+                deadline, entry_id, callback = self._heap[0]
+                if entry_id in self._cancelled:
+                    heapq.heappop(self._heap)
+                    self._live.discard(entry_id)
+                    self._cancelled.discard(entry_id)
+                    continue
+                
+                delay = deadline - time.monotonic()
+                if delay <= 0:
+                    heapq.heappop(self._heap)
+                    self._live.discard(entry_id)
+                    return callback
+                self._cv.wait(delay)
+    
+    def _run(self):
+        while True:
+            callback = self._next_due()
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error in scheduled callback: {e}")
+
+
+# Shared by all scheduled tasks so they don't each need their own timer thread
+scheduler = _Scheduler()
+
+
 class ScheduledTask:
     """Represents a scheduled task for one or more LEDs"""
     
-    def __init__(self, task_id: int, leds: List[LED], start_time: int, duration: int, brightness: int = 100, restore_original: bool = True):
+    def __init__(self, task_id: int, matrix: "LEDMatrix", led_ids: array, start_time: int, duration: int, brightness: int = 100,
+                 restore_original: bool = True, on_complete: Optional[Callable[["ScheduledTask"], None]] = None):
         """
         Initialize a scheduled task
         
         Args:
             task_id: Unique identifier for this task
-            leds: List of LEDs to control
+            matrix: Matrix that owns the LEDs
+            led_ids: Indices of the LEDs to control (array('H'))
             start_time: Time to turn on (in time units from now)
             duration: How long to stay on (in time units)
             brightness: Brightness level (0-100)
             restore_original: Whether to restore original brightness after task completes
+            on_complete: Called with the task once it has restored its LEDs or been cancelled
         """
+        self._reinit(task_id, matrix, led_ids, start_time, duration, brightness, restore_original, on_complete)
+    
+    def _reinit(self, task_id: int, matrix: "LEDMatrix", led_ids: array, start_time: int, duration: int, brightness: int = 100,
+                restore_original: bool = True, on_complete: Optional[Callable[["ScheduledTask"], None]] = None):
+        """Reset every field so a pooled task object can be reused (same arguments as __init__)"""
         self.task_id = task_id
-        self.leds = leds
+        self._matrix = matrix
+        self._ids = led_ids
         self.start_time = start_time
         self.duration = duration
-        self.brightness = brightness
+        self.brightness = _clamp_level(brightness)
         self.restore_original = restore_original
         self.executed = False
-        self.timer = None
-        self.original_brightness = {led.led_id: led.brightness for led in leds}
+        self._entry_id = None
+        # Absolute deadlines, so time spent running the on step doesn't delay the off step
+        self._t0 = time.monotonic()
+        self._on_at = self._t0 + start_time * TIME_UNIT
+        self._off_at = self._on_at + duration * TIME_UNIT
+        # Brightness of each LED at schedule time, parallel to _ids
+        self._orig = array('B', map(matrix._brightness.__getitem__, led_ids))
+        self._on_complete = on_complete
+    
+    @property
+    def leds(self) -> List[LED]:
+        """LED objects controlled by this task"""
+        return [self._matrix.leds[led_id] for led_id in self._ids] if self._matrix else []
+    
+    def _release(self):
+        """Drop references to the matrix and callbacks before the task goes back to a pool"""
+        self._matrix = None
+        self._ids = array('H')
+        self._orig = array('B')
+        self._on_complete = None
         
     def schedule(self):
         """Schedule this task to execute"""
-        self.timer = threading.Timer(self.start_time * TIME_UNIT, self.execute)
-        self.timer.start()
+        # Bound to the current task ID: a pooled object may be reinitialized for a
+        # new task while a stale callback is already popped off the scheduler
+        self._entry_id = scheduler.schedule(self._on_at, partial(self._execute_if_current, self.task_id))
+    
+    def _execute_if_current(self, task_id: int):
+        """Execute the task unless this object has since been reused for another task"""
+        if task_id == self.task_id:
+            self.execute()
         
     def execute(self):
         """Execute the task - turn on all LEDs at specified brightness"""
@@ -106,22 +341,25 @@ class ScheduledTask:
         self.executed = True
         
         # Turn on all LEDs at specified brightness
-        for led in self.leds:
-            led.on(self.brightness)
+        matrix = self._matrix
+        LED.set_many(matrix, self._ids, self.brightness)
         
-        led_ids = [led.led_id for led in self.leds]
-        logger.debug(f"Executed task {self.task_id} for LEDs {led_ids}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executed task %d for LEDs %s", self.task_id, self._ids.tolist())
         
         # Schedule turning off or restoring original brightness
         def restore():
-            for led in self.leds:
-                if self.restore_original and self.original_brightness[led.led_id] > 0:
-                    led.brightness = self.original_brightness[led.led_id]
-                else:
-                    led.off()
-            logger.debug(f"Completed task {self.task_id} for LEDs {led_ids}")
+            matrix._write_ids(self._ids, self._orig if self.restore_original else itertools.repeat(0))
+            matrix._flush_dirty()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Completed task %d for LEDs %s", self.task_id, self._ids.tolist())
+            self._complete()
         
-        threading.Timer(self.duration * TIME_UNIT, restore).start()
+        scheduler.schedule(self._off_at, restore)
+    
+    def _complete(self):
+        if self._on_complete:
+            self._on_complete(self)
     
     def cancel(self) -> bool:
         """Cancel the task if it hasn't executed yet"""
@@ -129,19 +367,20 @@ class ScheduledTask:
             logger.warning(f"Task {self.task_id} already executed")
             return False
         
-        if self.timer:
-            self.timer.cancel()
+        if self._entry_id is not None:
+            scheduler.cancel(self._entry_id)
         
         self.executed = True  # Mark as executed so it won't run
-        led_ids = [led.led_id for led in self.leds]
-        logger.debug(f"Cancelled task {self.task_id} for LEDs {led_ids}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Cancelled task %d for LEDs %s", self.task_id, self._ids.tolist())
+        self._complete()
         return True
 
 
 class LEDMatrix:
     """A matrix of LEDs arranged in rows and columns"""
     
-    def __init__(self, rows: int, cols: int, controllers=None):
+    def __init__(self, rows: int, cols: int, controllers=None, io_thread: bool = False):
         """
         Initialize an LED matrix
         
@@ -149,20 +388,35 @@ class LEDMatrix:
             rows: Number of rows in the matrix
             cols: Number of columns in the matrix
             controllers: List of hardware controllers
+            io_thread: If True, bulk operations hand controller flushes to a
+                background thread instead of blocking on the bus
         """
         self.rows = rows
         self.cols = cols
         self.controllers = controllers
         self.leds: List[LED] = []
-        self._scheduled_tasks: List[ScheduledTask] = []
+        # Brightness (0-100) and duty cycle of every LED in row-major order;
+        # the LED objects are views into these buffers
+        self._brightness = array('B', bytes(rows * cols))
+        self._duty = array('H', [0]) * (rows * cols)
+        # Nonzero for LEDs whose duty cycle hasn't been written to hardware yet
+        self._dirty = bytearray(rows * cols)
+        # Live tasks (pending or waiting to restore) by task ID
+        self._tasks_by_id: Dict[int, ScheduledTask] = {}
+        self._task_pool: List[ScheduledTask] = []
+        self._tasks_lock = threading.Lock()
         self._next_task_id = 0
+        # Scheduler entries for the blink sequence in progress, if any
+        self._blink_entries: List[int] = []
         
-        # Create all LEDs
+        # Resolve every LED's (controller, channel) address once up front
         total_leds = rows * cols
-        for i in range(total_leds):
+        self._addresses = [_compute_addr(row, col, cols) for row in range(rows) for col in range(cols)]
+        
+        # Create all LEDs
+        for i, (controller_idx, channel) in enumerate(self._addresses):
             # Determine controller and channel
             if controllers:
-                controller_idx = i // 16
                 if controller_idx < len(controllers):
                     controller = controllers[controller_idx]
                 else:
@@ -171,7 +425,14 @@ class LEDMatrix:
             else:
                 controller = None
             
-            self.leds.append(LED(i, controller, i % 16))
+            led = LED(i, controller, channel)
+            led._bind(self._brightness, self._duty, i)
+            self.leds.append(led)
+        
+        self._cmd_q: Optional[queue.Queue] = None
+        if io_thread:
+            self._cmd_q = queue.Queue(IO_BATCH_LIMIT)
+            threading.Thread(target=self._io_worker, daemon=True).start()
         
         logger.info(f"Created LED matrix with {rows} rows and {cols} columns ({total_leds} LEDs total)")
     
@@ -211,17 +472,88 @@ class LEDMatrix:
         col = led_id % self.cols
         return (row, col)
     
+    def flush(self):
+        """Send pending channel writes to every batched controller in one transaction each"""
+        if self._cmd_q is None:
+            self._flush_controllers()
+            return
+        
+        try:
+            self._cmd_q.put_nowait("flush")
+        except queue.Full:
+            # Flushes already queued will pick up these writes too
+            pass
+    
+    def _flush_controllers(self):
+        for controller in self.controllers or ():
+            flush_controller(controller)
+    
+    def _io_worker(self):
+        """Drain queued flush requests in batches, writing each batch to the bus once"""
+        while True:
+            batch = [self._cmd_q.get()]
+            while len(batch) < IO_BATCH_LIMIT:
+                try:
+                    batch.append(self._cmd_q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                self._flush_controllers()
+            except Exception as e:
+                logger.error(f"Error flushing LED controllers: {e}")
+    
+    def _write(self, region: slice, levels: array):
+        """
+        Store brightness levels for a slice of LEDs and mark the ones that changed as dirty
+        
+        Args:
+            region: Slice of LED indices (row-major)
+            levels: Clamped brightness levels (0-100), one per LED in the slice
+        """
+        previous = self._brightness[region]
+        self._brightness[region] = levels
+        self._duty[region] = array('H', map(_DUTY_LUT.__getitem__, levels))
+        
+        dirty = self._dirty
+        for led_id, old, new in zip(range(len(dirty))[region], previous, levels):
+            if old != new:
+                dirty[led_id] = 1
+    
+    def _write_ids(self, led_ids: array, levels: Iterable[int]):
+        """
+        Store brightness levels for scattered LEDs and mark the ones that changed as dirty
+        
+        Args:
+            led_ids: LED indices
+            levels: Clamped brightness levels (0-100), parallel to led_ids
+        """
+        brightness, duty, dirty = self._brightness, self._duty, self._dirty
+        for led_id, level in zip(led_ids, levels):
+            if brightness[led_id] != level:
+                brightness[led_id] = level
+                duty[led_id] = _DUTY_LUT[level]
+                dirty[led_id] = 1
+    
+    def _flush_dirty(self):
+        """Write every dirty LED's duty cycle to its controller, then flush the controllers"""
+        dirty = self._dirty
+        led_id = dirty.find(1)
+        while led_id != -1:
+            dirty[led_id] = 0
+            self.leds[led_id]._push(defer=True)
+            led_id = dirty.find(1, led_id + 1)
+        self.flush()
+    
     def all_off(self):
         """Turn all LEDs off"""
-        for led in self.leds:
-            led.off()
+        LED.set_many(self, slice(None), 0)
         logger.debug("All LEDs turned off")
     
     def all_on(self, brightness: int = 100):
         """Turn all LEDs on at specified brightness"""
-        for led in self.leds:
-            led.on(brightness)
-        logger.debug(f"All LEDs turned on at brightness {brightness}")
+        LED.set_many(self, slice(None), brightness)
+        logger.debug("All LEDs turned on at brightness %d", brightness)
     
     def set_row(self, row: int, brightness: int = 100):
         """Turn on all LEDs in a specific row"""
@@ -229,9 +561,8 @@ class LEDMatrix:
             logger.error(f"Row {row} is out of bounds")
             return
         
-        for col in range(self.cols):
-            self.led_at(row, col).on(brightness)
-        logger.debug(f"Row {row} turned on at brightness {brightness}")
+        LED.set_many(self, slice(row * self.cols, (row + 1) * self.cols), brightness)
+        logger.debug("Row %d turned on at brightness %d", row, brightness)
     
     def set_column(self, col: int, brightness: int = 100):
         """Turn on all LEDs in a specific column"""
@@ -239,9 +570,8 @@ class LEDMatrix:
             logger.error(f"Column {col} is out of bounds")
             return
         
-        for row in range(self.rows):
-            self.led_at(row, col).on(brightness)
-        logger.debug(f"Column {col} turned on at brightness {brightness}")
+        LED.set_many(self, slice(col, None, self.cols), brightness)
+        logger.debug("Column %d turned on at brightness %d", col, brightness)
     
     def set_pattern(self, pattern: List[List[int]]):
         """
@@ -251,20 +581,57 @@ class LEDMatrix:
             pattern: 2D list of brightness values (0-100)
         """
         for row in range(min(len(pattern), self.rows)):
-            for col in range(min(len(pattern[row]), self.cols)):
-                led = self.led_at(row, col)
-                if led:
-                    led.brightness = pattern[row][col]
+            levels = _clamp_levels(pattern[row][:self.cols])
+            start = row * self.cols
+            self._write(slice(start, start + len(levels)), levels)
+        self._flush_dirty()
         logger.debug("Pattern set on LED matrix")
     
-    def blink_sequence(self, delay: int = 10):
-        """Blink each LED in sequence with a delay between each"""
+    def blink_sequence(self, delay: int = 10) -> float:
+        """
+        Blink each LED in sequence with a delay between each
+        
+        The steps are queued on the shared scheduler and this returns immediately.
+        
+        Args:
+            delay: How long each LED stays on (in time units)
+            
+        Returns:
+            time.monotonic() deadline at which the last LED switches off
+        """
+        self.abort()
+        self.all_off()
+        # Absolute deadlines, so hardware write time doesn't accumulate as drift
+        t0 = time.monotonic()
+        step = delay * TIME_UNIT
+        count = len(self.leds)
+        # Each step switches the previous LED off and the next one on in a single flush
+        self._blink_entries = [
+            scheduler.schedule(t0 + i * step, partial(self._blink_step, i - 1, i))
+            for i in range(count + 1)
+        ]
+        logger.debug("Blink sequence scheduled with delay %s", delay)
+        return t0 + count * step
+    
+    def _blink_step(self, previous: int, current: int):
+        """Turn one blink-sequence LED off and the next one on"""
+        if previous >= 0:
+            self._write_ids((previous,), (0,))
+        if current < len(self.leds):
+            self._write_ids((current,), (100,))
+        else:
+            self._blink_entries = []
+        self._flush_dirty()
+    
+    def abort(self):
+        """Stop a blink sequence in progress and turn its LED off"""
+        entries, self._blink_entries = self._blink_entries, []
+        if not entries:
+            return
+        for entry_id in entries:
+            scheduler.cancel(entry_id)
         self.all_off()
-        for led in self.leds:
-            led.on()
-            time.sleep(delay * TIME_UNIT)
-            led.off()
-        logger.debug(f"Blink sequence completed with delay {delay}")
+        logger.debug("Blink sequence aborted")
     
     def schedule_leds(self, led_ids: List[int], start_time: int, duration: int, brightness: int = 100, restore_original: bool = True) -> int:
         """
@@ -280,22 +647,64 @@ class LEDMatrix:
         Returns:
             task_id: ID of the scheduled task
         """
-        # Get LED objects from IDs
-        leds = [self.leds[led_id] for led_id in led_ids if 0 <= led_id < len(self.leds)]
+        # Keep only valid LED IDs
+        count = len(self.leds)
+        ids = array('H', [led_id for led_id in led_ids if 0 <= led_id < count])
         
-        if not leds:
+        if not ids:
             logger.error("No valid LEDs to schedule")
             return -1
         
-        task_id = self._next_task_id
-        self._next_task_id += 1
+        return self._schedule_ids(ids, start_time, duration, brightness, restore_original)
+    
+    def _schedule_ids(self, ids: array, start_time: int, duration: int, brightness: int, restore_original: bool) -> int:
+        """Schedule a task for a non-empty array('H') of LED IDs already known to be in range"""
+        return self._schedule_batch([(ids, start_time, duration, brightness)], restore_original)[0]
+    
+    def _schedule_batch(self, entries: List[Tuple[array, int, int, int]], restore_original: bool) -> List[int]:
+        """
+        Create and schedule several tasks under one acquisition of the task lock
+        
+        Args:
+            entries: (LED IDs, start_time, duration, brightness) per task, IDs as in _schedule_ids
+            restore_original: Whether to restore original brightness after each task completes
+            
+        Returns:
+            List of task IDs, one per entry
+        """
+        tasks = []
+        task_ids = []
+        with self._tasks_lock:
+            for ids, start_time, duration, brightness in entries:
+                task_id = self._next_task_id
+                self._next_task_id += 1
+                if self._task_pool:
+                    task = self._task_pool.pop()
+                    task._reinit(task_id, self, ids, start_time, duration, brightness, restore_original, self._reap_task)
+                else:
+                    task = ScheduledTask(task_id, self, ids, start_time, duration, brightness, restore_original, self._reap_task)
+                self._tasks_by_id[task_id] = task
+                tasks.append(task)
+                task_ids.append(task_id)
         
-        task = ScheduledTask(task_id, leds, start_time, duration, brightness, restore_original)
-        self._scheduled_tasks.append(task)
-        task.schedule()
+        for task in tasks:
+            task.schedule()
         
-        logger.debug(f"Scheduled task {task_id} for LEDs {led_ids}: start={start_time}, duration={duration}, brightness={brightness}")
-        return task_id
+        if logger.isEnabledFor(logging.DEBUG):
+            for task_id, (ids, start_time, duration, brightness) in zip(task_ids, entries):
+                logger.debug("Scheduled task %d for LEDs %s: start=%s, duration=%s, brightness=%s",
+                             task_id, ids.tolist(), start_time, duration, brightness)
+        return task_ids
+    
+    def _reap_task(self, task: ScheduledTask):
+        """Drop a finished or cancelled task and keep its object for reuse"""
+        with self._tasks_lock:
+            if self._tasks_by_id.get(task.task_id) is not task:
+                return
+            del self._tasks_by_id[task.task_id]
+            if len(self._task_pool) < TASK_POOL_SIZE:
+                task._release()
+                self._task_pool.append(task)
     
     def schedule_led(self, led_id: int, start_time: int, duration: int, brightness: int = 100, restore_original: bool = True) -> int:
         """
@@ -331,8 +740,8 @@ class LEDMatrix:
             logger.error(f"Row {row} is out of bounds")
             return -1
         
-        led_ids = [row * self.cols + col for col in range(self.cols)]
-        return self.schedule_leds(led_ids, start_time, duration, brightness, restore_original)
+        ids = array('H', range(row * self.cols, (row + 1) * self.cols))
+        return self._schedule_ids(ids, start_time, duration, brightness, restore_original)
     
     def schedule_column(self, col: int, start_time: int, duration: int, brightness: int = 100, restore_original: bool = True) -> int:
         """
@@ -352,8 +761,8 @@ class LEDMatrix:
             logger.error(f"Column {col} is out of bounds")
             return -1
         
-        led_ids = [row * self.cols + col for row in range(self.rows)]
-        return self.schedule_leds(led_ids, start_time, duration, brightness, restore_original)
+        ids = array('H', range(col, self.rows * self.cols, self.cols))
+        return self._schedule_ids(ids, start_time, duration, brightness, restore_original)
     
     def schedule_all(self, start_time: int, duration: int, brightness: int = 100, restore_original: bool = True) -> int:
         """
@@ -368,8 +777,12 @@ class LEDMatrix:
         Returns:
             task_id: ID of the scheduled task
         """
-        led_ids = list(range(len(self.leds)))
-        return self.schedule_leds(led_ids, start_time, duration, brightness, restore_original)
+        if not self.leds:
+            logger.error("No valid LEDs to schedule")
+            return -1
+        
+        ids = array('H', range(len(self.leds)))
+        return self._schedule_ids(ids, start_time, duration, brightness, restore_original)
     
     def schedule_pattern(self, pattern: List[List[int]], start_time: int, duration: int, restore_original: bool = True) -> List[int]:
         """
@@ -384,26 +797,58 @@ class LEDMatrix:
         Returns:
             List of task IDs
         """
-        task_ids = []
+        return self.schedule_patterns([pattern], [start_time], [duration], restore_original)
+    
+    def schedule_patterns(self, patterns: Sequence[Sequence[Sequence[int]]], start_times: Sequence[int],
+                          durations: Sequence[int], restore_original: bool = True) -> List[int]:
+        """
+        Schedule several patterns in one call, each at its own time for its own duration
         
-        # Group LEDs by brightness value to minimize the number of tasks
-        brightness_groups = {}
+        Args:
+            patterns: 2D brightness patterns (0-100), as for schedule_pattern
+            start_times: Time to show each pattern (in time units from now)
+            durations: How long to show each pattern (in time units)
+            restore_original: Whether to restore original brightness after each task completes
+            
+        Returns:
+            List of task IDs for all patterns, in order
+        """
+        entries = []
+        # Shared across the batch: sequences reuse the same rows frame after frame
+        lit_cache: Dict[bytes, List[Tuple[int, int]]] = {}
+        for pattern, start_time, duration in zip(patterns, start_times, durations):
+            # One task per brightness value in the pattern, in first-seen order
+            for brightness, led_ids in self._group_pattern(pattern, lit_cache).items():
+                entries.append((array('H', led_ids), start_time, duration, brightness))
+        return self._schedule_batch(entries, restore_original)
+    
+    def _group_pattern(self, pattern: Sequence[Sequence[int]],
+                       lit_cache: Optional[Dict[bytes, List[Tuple[int, int]]]] = None) -> Dict[int, List[int]]:
+        """
+        Group the IDs of a pattern's lit LEDs by brightness value
         
-        for row in range(min(len(pattern), self.rows)):
-            for col in range(min(len(pattern[row]), self.cols)):
-                brightness = pattern[row][col]
-                if brightness > 0:  # Only schedule LEDs that need to be on
-                    led_id = row * self.cols + col
-                    if brightness not in brightness_groups:
-                        brightness_groups[brightness] = []
-                    brightness_groups[brightness].append(led_id)
-        
-        # Create a task for each brightness group
-        for brightness, led_ids in brightness_groups.items():
-            task_id = self.schedule_leds(led_ids, start_time, duration, brightness, restore_original)
-            task_ids.append(task_id)
+        Rows given as bytes, as LightingPattern builds them, are scanned once per
+        distinct value and their lit (column, brightness) pairs kept in lit_cache,
+        so dark rows and rows repeated across uniform frames cost one lookup.
+        """
+        brightness_groups = defaultdict(list)
+        if lit_cache is None:
+            lit_cache = {}
         
-        return task_ids
+        cols = self.cols
+        for row, values in enumerate(pattern[:self.rows]):
+            base = row * cols
+            hashable = isinstance(values, bytes)
+            lit = lit_cache.get(values) if hashable else None
+            if lit is None:
+                # Only LEDs that need to be on are scheduled
+                lit = [(col, brightness) for col, brightness in enumerate(values[:cols]) if brightness > 0]
+                if hashable:
+                    lit_cache[values] = lit
+            for col, brightness in lit:
+                brightness_groups[brightness].append(base + col)
+        
+        return brightness_groups
     
     def cancel_task(self, task_id: int) -> bool:
         """
@@ -415,9 +860,9 @@ class LEDMatrix:
         Returns:
             Success: True if task was cancelled, False otherwise
         """
-        for task in self._scheduled_tasks:
-            if task.task_id == task_id:
-                return task.cancel()
+        task = self._tasks_by_id.get(task_id)
+        if task is not None:
+            return task.cancel()
         
         logger.error(f"Task {task_id} not found")
         return False
@@ -425,7 +870,7 @@ class LEDMatrix:
     def get_scheduled_task_count(self) -> int:
         """Return number of tasks scheduled"""
         # Count tasks that haven't been executed yet
-        return sum(1 for task in self._scheduled_tasks if not task.executed)
+        return sum(1 for task in list(self._tasks_by_id.values()) if not task.executed)
     
     def __str__(self) -> str:
         return f"LEDMatrix({self.rows}x{self.cols}, {len(self.leds)} LEDs)"
@@ -442,34 +887,130 @@ class LEDManager:
             hardware: Hardware controller object (PCA9685 or mock)
         """
         self.hardware = hardware
-        self.leds = {}  # Dictionary to store LED objects by ID
+        # LED objects indexed by ID (IDs are small and dense); None for unused IDs
+        self.leds: List[Optional[LED]] = []
+        # Contiguous brightness (0-100) and duty cycle buffers indexed by LED ID;
+        # each LED is bound to its slot, as in LEDMatrix
+        self._levels = array('B')
+        self._duties = array('H')
+        self._led_count = 0
         self._next_led_id = 0
         
     @property
     def num_leds(self) -> int:
         """Get the number of LEDs being managed"""
-        return len(self.leds)
+        return self._led_count
     
-    def set_led(self, led_id: int, brightness: float):
+    def _get_or_create(self, led_id: int) -> Optional[LED]:
+        """Get the LED with this ID, creating it on first use; None for invalid IDs"""
+        if led_id < 0:
+            logger.error(f"Invalid LED ID: {led_id}")
+            return None
+        
+        if led_id >= len(self.leds):
+            missing = led_id + 1 - len(self.leds)
+            self.leds.extend([None] * missing)
+            self._levels.frombytes(bytes(missing))
+            self._duties.frombytes(bytes(missing * self._duties.itemsize))
+        led = self.leds[led_id]
+        if led is None:
+            led = self.leds[led_id] = LED(led_id, self.hardware, led_id % 16)
+            led._bind(self._levels, self._duties, led_id)
+            self._led_count += 1
+        return led
+    
+    def set_led(self, led_id: int, brightness: Union[int, float]):
         """
         Set the brightness of an LED
         
         Args:
             led_id: ID of the LED to control
+            brightness: Brightness level from 0.0 (off) to 1.0 (full brightness);
+                the ints 0 and 1 skip float math entirely
+        """
+        # Get or create LED object
+        led = self._get_or_create(led_id)
+        if led is None:
+            return
+        
+        # Clamp and convert to the LED's 0-100 scale in one step
+        led.set_brightness(_fraction_to_level(brightness))
+    
+    def set_many(self, led_ids: Iterable[int], level: int):
+        """
+        Set several LEDs to one brightness, flushing each controller once
+        
+        Takes the integer 0-100 level the LEDs store, so callers that already
+        have one skip the float round trip of set_led.
+        
+        Args:
+            led_ids: IDs of the LEDs to control
+            level: Brightness level from 0 (off) to 100 (full brightness)
+        """
+        leds = []
+        for led_id in led_ids:
+            led = self._get_or_create(led_id)
+            if led is not None:
+                led.set_brightness(level, defer=True)
+                leds.append(led)
+        flush_leds(leds)
+    
+    def set_all(self, brightness: Union[int, float]):
+        """
+        Set every managed LED to one brightness, flushing each controller once
+        
+        Args:
             brightness: Brightness level from 0.0 (off) to 1.0 (full brightness)
         """
-        # Clamp brightness between 0 and 1
-        brightness = max(0.0, min(1.0, brightness))
+        level = _fraction_to_level(brightness)
+        leds = [led for led in self.leds if led]
+        for led in leds:
+            led.set_brightness(level, defer=True)
+        flush_leds(leds)
+    
+    def set_levels(self, led_ids: Sequence[int], levels: Sequence[int]):
+        """
+        Set scattered LEDs to their own levels, flushing each controller once
         
-        # Convert to 0-100 scale for LED class
-        brightness_percent = int(brightness * 100)
+        Args:
+            led_ids: IDs of the LEDs to control
+            levels: Brightness level (0-100) for each LED, parallel to led_ids
+        """
+        leds = []
+        for led_id, level in zip(led_ids, levels):
+            led = self._get_or_create(led_id)
+            if led is not None:
+                led.set_brightness(level, defer=True)
+                leds.append(led)
+        flush_leds(leds)
+    
+    def schedule_brightness_curve(self, led_id: int, levels: Sequence[int], duration: float) -> threading.Event:
+        """
+        Step an LED through brightness levels spread evenly over a duration
         
-        # Get or create LED object
-        if led_id not in self.leds:
-            self.leds[led_id] = LED(led_id, self.hardware, led_id % 16)
+        The steps run on the shared scheduler thread, so this returns immediately.
+        
+        Args:
+            led_id: ID of the LED to control
+            levels: Brightness levels (0-100) to show in order
+            duration: Time to spread the levels over (in seconds)
+            
+        Returns:
+            Event that is set once the last level has been applied
+        """
+        done = threading.Event()
+        led = self._get_or_create(led_id)
+        if led is None or not levels:
+            done.set()
+            return done
         
-        # Set brightness
-        self.leds[led_id].brightness = brightness_percent
+        t0 = time.monotonic()
+        step = duration / len(levels)
+        for i, level in enumerate(levels):
+            scheduler.schedule(t0 + i * step, partial(led.set_brightness, level))
+        # Same deadline as the last level; the scheduler runs equal deadlines in order
+        scheduler.schedule(t0 + (len(levels) - 1) * step, done.set)
+        return done
     
     def get_led_state(self, led_id: int) -> float:
         """
@@ -481,18 +1022,17 @@ class LEDManager:
         Returns:
             Current brightness level from 0.0 to 1.0
         """
-        if led_id not in self.leds:
+        led = self.leds[led_id] if 0 <= led_id < len(self.leds) else None
+        if led is None:
             return 0.0
         
         # Convert from 0-100 scale back to 0-1
-        return self.leds[led_id].brightness / 100.0
+        return led.brightness / 100.0
     
     def all_off(self):
         """Turn all LEDs off"""
-        for led in self.leds.values():
-            led.off()
+        self.set_all(0.0)
     
     def all_on(self, brightness: float = 1.0):
         """Turn all LEDs on at specified brightness"""
-        for led in self.leds.values():
-            self.set_led(led.led_id, brightness)
\ No newline at end of file
+        self.set_all(brightness)
\ No newline at end of file
@@ -2,6 +2,10 @@ import tkinter as tk
 from typing import Optional
 from led_control.led_management import LEDMatrix, LED
 
+# Pixel color for each brightness level 0-100, built once instead of per frame
+_OFF_COLOR = '#ff0000'
+_COLOR_LUT = (_OFF_COLOR,) + tuple('#%02x%02x%02x' % (g, g, g) for g in (v * 255 // 100 for v in range(1, 101)))
+
 class LEDVisualizer:
     """GUI visualization of an LED matrix"""
     
@@ -35,9 +39,19 @@ class LEDVisualizer:
         )
         self.canvas.pack()
         
+        # One pixel per LED, scaled up into the displayed image with a single
+        # copy, so a frame costs two Tcl calls however many LEDs there are
+        stride = size + padding
+        self._pixels = tk.PhotoImage(width=matrix.cols, height=matrix.rows)
+        self._image = tk.PhotoImage(width=matrix.cols * stride, height=matrix.rows * stride)
+        self.canvas.create_image(padding, padding, anchor='nw', image=self._image)
+        
         # Store circle IDs for each LED
         self.led_circles = {}
         
+        # Brightness levels last drawn; None forces the first frame to paint
+        self._last_brightness: Optional[bytes] = None
+        
         # Create initial circles
         self._create_circles()
         
@@ -45,37 +59,52 @@ class LEDVisualizer:
         self._update_display()
     
     def _create_circles(self):
-        """Create circles for all LEDs"""
+        """Draw the static gaps and LED outlines over the image"""
+        stride = self.size + self.padding
+        width = stride * self.matrix.cols + self.padding
+        height = stride * self.matrix.rows + self.padding
+        
+        # Black out the padding between cells
+        for col in range(self.matrix.cols):
+            x = stride * col + self.padding + self.size
+            self.canvas.create_rectangle(x, 0, x + self.padding, height, fill='black', width=0)
+        for row in range(self.matrix.rows):
+            y = stride * row + self.padding + self.size
+            self.canvas.create_rectangle(0, y, width, y + self.padding, fill='black', width=0)
+        
+        # Circle centers are base + stride * index on each axis
+        half = self.size / 2
+        base = self.padding + half
+        xs = [stride * col + base for col in range(self.matrix.cols)]
         for row in range(self.matrix.rows):
-            for col in range(self.matrix.cols):
-                x = (self.size + self.padding) * col + self.padding + self.size/2
-                y = (self.size + self.padding) * row + self.padding + self.size/2
-                
+            y = stride * row + base
+            for col, x in enumerate(xs):
                 led = self.matrix.led_at(row, col)
                 if led:
                     circle = self.canvas.create_oval(
-                        x - self.size/2, y - self.size/2,
-                        x + self.size/2, y + self.size/2,
-                        fill='red',  # Default color for off state
+                        x - half, y - half,
+                        x + half, y + half,
                         outline='darkgray'
                     )
                     self.led_circles[led.led_id] = circle
     
     def _update_display(self):
         """Update the display to reflect current LED states"""
-        for led_id, circle in self.led_circles.items():
-            led = self.matrix.leds[led_id]
-            if led.is_on():
-                # Calculate color based on brightness
-                brightness_hex = hex(int(led.brightness * 255 / 100))[2:].zfill(2)
-                color = f'#{brightness_hex}{brightness_hex}{brightness_hex}'
-                self.canvas.itemconfig(circle, fill=color)
-            else:
-                self.canvas.itemconfig(circle, fill='red')
+        levels = bytes(self.matrix._brightness)
+        if levels != self._last_brightness:
+            self._last_brightness = levels
+            cols = self.matrix.cols
+            data = ' '.join(
+                '{' + ' '.join(map(_COLOR_LUT.__getitem__, levels[start:start + cols])) + '}'
+                for start in range(0, len(levels), cols)
+            )
+            self._pixels.put(data)
+            stride = self.size + self.padding
+            self._image.tk.call(self._image, 'copy', self._pixels, '-zoom', stride, stride)
         
         # Schedule next update
         self.root.after(50, self._update_display)
     
     def run(self):
         """Start the visualization"""
-        self.root.mainloop() 
\ No newline at end of file
+        self.root.mainloop()
\ No newline at end of file
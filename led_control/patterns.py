@@ -1,8 +1,122 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence, Tuple, NamedTuple
+from functools import lru_cache
+from itertools import accumulate
+import logging
 from .led_management import LEDMatrix
 import time
-from ..logging_setup import logger
-from ..constants import TIME_UNIT
+from logging_setup import logger
+from constants import TIME_UNIT
+
+# A pattern frame: one bytes object of brightness values (0-100) per row.
+# Frames are immutable, so identical rows are shared instead of copied.
+Frame = Tuple[bytes, ...]
+
+
+class Step(NamedTuple):
+    """One entry of a pattern sequence"""
+    pattern: Sequence[Sequence[int]]
+    duration: int
+    transition_time: int = 0
+
+
+def _level(brightness: int) -> int:
+    """Clamp a brightness to 0-100 so it fits in a pattern byte"""
+    return max(0, min(100, brightness))
+
+
+# The frame builders below are pure functions of their arguments and return
+# immutable frames, so repeated pattern builds share cached results
+
+@lru_cache(maxsize=128)
+def _band(cols: int, width: int, level: int) -> bytes:
+    """
+    A run of `width` lit LEDs padded with cols - 1 dark ones on each side
+    
+    The row with columns [start, start + width) lit, clipped to the matrix, is
+    _band(...)[cols - 1 - start:][:cols], so every row a builder needs is one
+    slice instead of a bytearray filled in Python.
+    """
+    pad = bytes(cols - 1)
+    return pad + bytes([level]) * width + pad
+
+
+def _lit_rows(cols: int, level: int) -> List[bytes]:
+    """Rows with exactly one LED lit, indexed by that LED's column"""
+    band = _band(cols, 1, level)
+    return [band[cols - 1 - col:2 * cols - 1 - col] for col in range(cols)]
+
+
+@lru_cache(maxsize=128)
+def _spiral_coordinates(rows: int, cols: int) -> Tuple[Tuple[int, int], ...]:
+    """(row, col) cells of a rows x cols matrix in clockwise spiral order, outside in"""
+    coordinates = []
+    top, bottom = 0, rows - 1
+    left, right = 0, cols - 1
+    
+    while top <= bottom and left <= right:
+        # Top row
+        for i in range(left, right + 1):
+            coordinates.append((top, i))
+        top += 1
+        
+        # Right column
+        for i in range(top, bottom + 1):
+            coordinates.append((i, right))
+        right -= 1
+        
+        if top <= bottom:
+            # Bottom row
+            for i in range(right, left - 1, -1):
+                coordinates.append((bottom, i))
+            bottom -= 1
+        
+        if left <= right:
+            # Left column
+            for i in range(bottom, top - 1, -1):
+                coordinates.append((i, left))
+            left += 1
+    
+    return tuple(coordinates)
+
+
+@lru_cache(maxsize=128)
+def _spiral_frames(rows: int, cols: int, clockwise: bool, level: int) -> Tuple[Frame, ...]:
+    """One frame per cell of the spiral, each lighting only that cell"""
+    coordinates = _spiral_coordinates(rows, cols)
+    if not clockwise:
+        coordinates = coordinates[::-1]
+    
+    # Each frame lights one cell, so one lit row per column covers every frame
+    zero = (bytes(cols),) * rows
+    lit_rows = _lit_rows(cols, level)
+    frames = []
+    for row, col in coordinates:
+        pattern = list(zero)
+        pattern[row] = lit_rows[col]
+        frames.append(tuple(pattern))
+    return tuple(frames)
+
+
+@lru_cache(maxsize=128)
+def _wave_frames(rows: int, cols: int, direction: str, width: int, level: int) -> Tuple[Frame, ...]:
+    """Frames of a band `width` LEDs wide sweeping across the matrix"""
+    # Both axes use the padded-band trick: every frame is one slice, walked in
+    # reverse for "left" and "up" since the band is symmetric
+    if direction in ["right", "left"]:
+        band = _band(cols, width, level)
+        offsets = range(cols + width - 1) if direction == "left" else range(cols + width - 2, -1, -1)
+        return tuple((band[offset:offset + cols],) * rows for offset in offsets)
+    
+    # up or down: the band is a run of whole lit rows padded with dark ones
+    pad = (bytes(cols),) * (rows - 1)
+    band = pad + (bytes([level]) * cols,) * width + pad
+    offsets = range(rows + width - 2, -1, -1) if direction == "down" else range(rows + width - 1)
+    return tuple(band[offset:offset + rows] for offset in offsets)
+
+
+def _chase_frames(rows: int, cols: int, direction: str, level: int) -> Tuple[Frame, ...]:
+    """Frames of a single row or column sweeping across the matrix"""
+    return _wave_frames(rows, cols, direction, 1, level)
 
 
 class LightingPattern:
@@ -18,44 +132,50 @@ class LightingPattern:
         """
         self.matrix = matrix
         self.name = name
-        self.pattern_sequence: List[Dict[str, Any]] = []
+        self.pattern_sequence: List[Step] = []
+        # All-off frame; builders start from list(self._zero_pattern) and replace only lit rows
+        self._zero_pattern: Frame = (bytes(matrix.cols),) * matrix.rows
         
-    def add_step(self, pattern: List[List[int]], duration: int, transition_time: int = 0):
+    def add_step(self, pattern: Sequence[Sequence[int]], duration: int, transition_time: int = 0):
         """
         Add a step to the pattern sequence
         
         Args:
-            pattern: 2D list of brightness values (0-100) matching matrix dimensions
+            pattern: Rows of brightness values (0-100) matching matrix dimensions,
+                e.g. a 2D list or a Frame
             duration: How long to display this pattern (in time units)
             transition_time: Time to transition from previous pattern (in time units)
         """
-        if len(pattern) != self.matrix.rows or any(len(row) != self.matrix.cols for row in pattern):
+        # map(len, ...) measures the rows without running Python code per row
+        if len(pattern) != self.matrix.rows or (pattern and set(map(len, pattern)) != {self.matrix.cols}):
             raise ValueError(f"Pattern dimensions must match matrix dimensions ({self.matrix.rows}x{self.matrix.cols})")
         
-        self.pattern_sequence.append({
-            "pattern": pattern,
-            "duration": duration,
-            "transition_time": transition_time
-        })
-        logger.debug(f"Added step to pattern '{self.name}' with duration {duration}")
+        self.pattern_sequence.append(Step(pattern, duration, transition_time))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Added step to pattern %r with duration %s", self.name, duration)
+    
+    def _add_frames(self, frames: Sequence[Frame], duration: int):
+        """Append prebuilt frames, already known to match the matrix, as steps"""
+        self.pattern_sequence.extend(Step(frame, duration) for frame in frames)
+        logger.debug("Added %d steps to pattern %r with duration %s", len(frames), self.name, duration)
     
     def add_row_step(self, row: int, brightness: int, duration: int, transition_time: int = 0):
         """Add a step that lights up a specific row"""
-        pattern = [[0] * self.matrix.cols for _ in range(self.matrix.rows)]
-        pattern[row] = [brightness] * self.matrix.cols
-        self.add_step(pattern, duration, transition_time)
+        pattern = list(self._zero_pattern)
+        pattern[row] = bytes([_level(brightness)]) * self.matrix.cols
+        self.add_step(tuple(pattern), duration, transition_time)
         
     def add_column_step(self, col: int, brightness: int, duration: int, transition_time: int = 0):
         """Add a step that lights up a specific column"""
-        pattern = [[0] * self.matrix.cols for _ in range(self.matrix.rows)]
-        for row in range(self.matrix.rows):
-            pattern[row][col] = brightness
-        self.add_step(pattern, duration, transition_time)
+        lit = bytearray(self.matrix.cols)
+        lit[col] = _level(brightness)
+        # Every row is the same, so they all share one bytes object
+        self.add_step((bytes(lit),) * self.matrix.rows, duration, transition_time)
     
     def clear_sequence(self):
         """Clear all steps in the pattern sequence"""
         self.pattern_sequence = []
-        logger.debug(f"Cleared pattern sequence for '{self.name}'")
+        logger.debug("Cleared pattern sequence for %r", self.name)
     
     def run_once(self, start_delay: int = 0) -> List[int]:
         """
@@ -68,25 +188,12 @@ class LightingPattern:
             List of task IDs created
         """
         if not self.pattern_sequence:
-            logger.warning(f"No steps in pattern '{self.name}'")
+            logger.warning("No steps in pattern %r", self.name)
             return []
         
-        task_ids = []
-        current_time = start_delay
-        
-        for step in self.pattern_sequence:
-            # Schedule the pattern
-            task_ids.extend(
-                self.matrix.schedule_pattern(
-                    step["pattern"],
-                    current_time,
-                    step["duration"],
-                    restore_original=True
-                )
-            )
-            current_time += step["duration"] + step["transition_time"]
+        task_ids = self._schedule(start_delay, 1)
         
-        logger.info(f"Scheduled pattern '{self.name}' with {len(self.pattern_sequence)} steps")
+        logger.info("Scheduled pattern %r with %d steps", self.name, len(self.pattern_sequence))
         return task_ids
     
     def run_loop(self, repetitions: int, start_delay: int = 0) -> List[int]:
@@ -100,15 +207,36 @@ class LightingPattern:
         Returns:
             List of all task IDs created
         """
-        all_task_ids = []
-        total_duration = sum(step["duration"] + step["transition_time"] for step in self.pattern_sequence)
+        if repetitions <= 0:
+            return []
+        if not self.pattern_sequence:
+            logger.warning("No steps in pattern %r", self.name)
+            return []
         
-        for i in range(repetitions):
-            current_delay = start_delay + (i * total_duration)
-            all_task_ids.extend(self.run_once(current_delay))
+        all_task_ids = self._schedule(start_delay, repetitions)
         
+        logger.info("Scheduled pattern %r with %d steps, %d times", self.name, len(self.pattern_sequence), repetitions)
         return all_task_ids
     
+    def _schedule(self, start_delay: int, repetitions: int) -> List[int]:
+        """Schedule the whole sequence `repetitions` times back to back in one batch"""
+        steps = self.pattern_sequence
+        # Each step starts when the previous one's duration and transition have elapsed;
+        # the final offset is the length of one repetition
+        offsets = list(accumulate((step.duration + step.transition_time for step in steps), initial=0))
+        total_duration = offsets.pop()
+        start_times = [
+            start_delay + i * total_duration + offset
+            for i in range(repetitions)
+            for offset in offsets
+        ]
+        return self.matrix.schedule_patterns(
+            [step.pattern for step in steps] * repetitions,
+            start_times,
+            [step.duration for step in steps] * repetitions,
+            restore_original=True
+        )
+    
     def stop(self, task_ids: List[int]):
         """
         Stop a running pattern by canceling its tasks
@@ -118,7 +246,7 @@ class LightingPattern:
         """
         for task_id in task_ids:
             self.matrix.cancel_task(task_id)
-        logger.info(f"Stopped pattern '{self.name}'")
+        logger.info("Stopped pattern %r", self.name)
 
     def add_chase_pattern(self, brightness: int = 100, direction: str = "right", duration_per_step: int = 5):
         """
@@ -129,14 +257,8 @@ class LightingPattern:
             direction: One of "right", "left", "up", "down"
             duration_per_step: How long each step should last
         """
-        if direction in ["right", "left"]:
-            for col in range(self.matrix.cols):
-                col_idx = col if direction == "right" else (self.matrix.cols - 1 - col)
-                self.add_column_step(col_idx, brightness, duration_per_step)
-        else:  # up or down
-            for row in range(self.matrix.rows):
-                row_idx = row if direction == "down" else (self.matrix.rows - 1 - row)
-                self.add_row_step(row_idx, brightness, duration_per_step)
+        frames = _chase_frames(self.matrix.rows, self.matrix.cols, direction, _level(brightness))
+        self._add_frames(frames, duration_per_step)
     
     def add_wave_pattern(self, brightness: int = 100, direction: str = "right", width: int = 2, duration_per_step: int = 5):
         """
@@ -148,25 +270,8 @@ class LightingPattern:
             width: Width of the wave in LEDs
             duration_per_step: How long each step should last
         """
-        if direction in ["right", "left"]:
-            for col in range(-width + 1, self.matrix.cols):
-                pattern = [[0] * self.matrix.cols for _ in range(self.matrix.rows)]
-                for w in range(width):
-                    curr_col = col + w
-                    if 0 <= curr_col < self.matrix.cols:
-                        for row in range(self.matrix.rows):
-                            col_idx = curr_col if direction == "right" else (self.matrix.cols - 1 - curr_col)
-                            pattern[row][col_idx] = brightness
-                self.add_step(pattern, duration_per_step)
-        else:  # up or down
-            for row in range(-width + 1, self.matrix.rows):
-                pattern = [[0] * self.matrix.cols for _ in range(self.matrix.rows)]
-                for w in range(width):
-                    curr_row = row + w
-                    if 0 <= curr_row < self.matrix.rows:
-                        row_idx = curr_row if direction == "down" else (self.matrix.rows - 1 - curr_row)
-                        pattern[row_idx] = [brightness] * self.matrix.cols
-                self.add_step(pattern, duration_per_step)
+        frames = _wave_frames(self.matrix.rows, self.matrix.cols, direction, width, _level(brightness))
+        self._add_frames(frames, duration_per_step)
     
     def add_pulse_pattern(self, max_brightness: int = 100, min_brightness: int = 0, steps: int = 10, duration_per_step: int = 2):
         """
@@ -178,16 +283,16 @@ class LightingPattern:
             steps: Number of steps in fade up/down
             duration_per_step: How long each step should last
         """
-        # Fade up
-        for i in range(steps):
-            brightness = min_brightness + ((max_brightness - min_brightness) * i // (steps - 1))
-            pattern = [[brightness] * self.matrix.cols for _ in range(self.matrix.rows)]
-            self.add_step(pattern, duration_per_step)
+        ramp = [(max_brightness - min_brightness) * i // (steps - 1) for i in range(steps)]
+        fade_up = [min_brightness + offset for offset in ramp]
+        fade_down = [max_brightness - offset for offset in ramp]
         
-        # Fade down
-        for i in range(steps):
-            brightness = max_brightness - ((max_brightness - min_brightness) * i // (steps - 1))
-            pattern = [[brightness] * self.matrix.cols for _ in range(self.matrix.rows)]
+        # Uniform frames, built once per distinct level and shared by both fades
+        frames: Dict[int, Frame] = {}
+        for brightness in fade_up + fade_down:
+            pattern = frames.get(brightness)
+            if pattern is None:
+                pattern = frames[brightness] = (bytes([_level(brightness)]) * self.matrix.cols,) * self.matrix.rows
             self.add_step(pattern, duration_per_step)
     
     def add_spiral_pattern(self, brightness: int = 100, clockwise: bool = True, duration_per_step: int = 3):
@@ -199,41 +304,8 @@ class LightingPattern:
             clockwise: Direction of spiral
             duration_per_step: How long each step should last
         """
-        def get_spiral_coordinates():
-            coordinates = []
-            top, bottom = 0, self.matrix.rows - 1
-            left, right = 0, self.matrix.cols - 1
-            
-            while top <= bottom and left <= right:
-                # Top row
-                for i in range(left, right + 1):
-                    coordinates.append((top, i))
-                top += 1
-                
-                # Right column
-                for i in range(top, bottom + 1):
-                    coordinates.append((i, right))
-                right -= 1
-                
-                if top <= bottom:
-                    # Bottom row
-                    for i in range(right, left - 1, -1):
-                        coordinates.append((bottom, i))
-                    bottom -= 1
-                
-                if left <= right:
-                    # Left column
-                    for i in range(bottom, top - 1, -1):
-                        coordinates.append((i, left))
-                    left += 1
-            
-            return coordinates if clockwise else coordinates[::-1]
-        
-        coordinates = get_spiral_coordinates()
-        for row, col in coordinates:
-            pattern = [[0] * self.matrix.cols for _ in range(self.matrix.rows)]
-            pattern[row][col] = brightness
-            self.add_step(pattern, duration_per_step)
+        frames = _spiral_frames(self.matrix.rows, self.matrix.cols, clockwise, _level(brightness))
+        self._add_frames(frames, duration_per_step)
     
     def add_random_sparkle(self, max_active: int = 3, brightness: int = 100, steps: int = 20, duration_per_step: int = 2):
         """
@@ -246,16 +318,28 @@ class LightingPattern:
             duration_per_step: How long each step should last
         """
         from random import sample
-        total_leds = self.matrix.rows * self.matrix.cols
+        cols = self.matrix.cols
+        total_leds = self.matrix.rows * cols
+        level = _level(brightness)
         
-        for _ in range(steps):
-            pattern = [[0] * self.matrix.cols for _ in range(self.matrix.rows)]
-            # Pick random LEDs to light up
-            active_leds = sample(range(total_leds), min(max_active, total_leds))
-            
+        # Pick every step's random LEDs in one pass over a shared population
+        leds = range(total_leds)
+        active = min(max_active, total_leds)
+        draws = [sample(leds, active) for _ in range(steps)]
+        
+        # Rows with a single lit LED (the common case) come from this table
+        lit_rows = _lit_rows(cols, level)
+        frames = []
+        for active_leds in draws:
+            pattern = list(self._zero_pattern)
             for led_idx in active_leds:
-                row = led_idx // self.matrix.cols
-                col = led_idx % self.matrix.cols
-                pattern[row][col] = brightness
-            
-            self.add_step(pattern, duration_per_step) 
\ No newline at end of file
+                row, col = divmod(led_idx, cols)
+                if pattern[row] is self._zero_pattern[row]:
+                    pattern[row] = lit_rows[col]
+                else:
+                    lit = bytearray(pattern[row])
+                    lit[col] = level
+                    pattern[row] = bytes(lit)
+            frames.append(tuple(pattern))
+        
+        self._add_frames(frames, duration_per_step)
\ No newline at end of file
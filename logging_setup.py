@@ -1,14 +1,39 @@
 import logging
+import os
+from typing import Optional, Union
 
 
-# Set up logging
-logging.basicConfig(
-    level=logging.WARN,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("led_controller.log"),
-        logging.StreamHandler()
-    ]
-)
+LOG_FILE = "led_controller.log"
 
-logger = logging.getLogger(__name__)
\ No newline at end of file
+
+def configure_logging(level: Optional[Union[int, str]] = None, log_file: Optional[str] = None):
+    """
+    Send log records to the console and, optionally, a log file
+
+    Call once from a program's entry point; importing this module has no side
+    effects, so library users and tests don't open the log file.
+
+    Args:
+        level: Minimum level to record; defaults to $BONGO_LOG_LEVEL, else WARNING
+        log_file: Path of the log file to append to; defaults to $BONGO_LOG_FILE,
+            else LOG_FILE. An empty path logs to the console only, so embedded
+            deployments can skip the file writes entirely.
+    """
+    if level is None:
+        level = os.environ.get("BONGO_LOG_LEVEL", "WARNING").upper()
+    if log_file is None:
+        log_file = os.environ.get("BONGO_LOG_FILE", LOG_FILE)
+
+    handlers = [logging.StreamHandler()]
+    if log_file:
+        handlers.insert(0, logging.FileHandler(log_file))
+
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=handlers
+    )
+
+logger = logging.getLogger(__name__)
+# Records are dropped quietly until an entry point calls configure_logging
+logger.addHandler(logging.NullHandler())
\ No newline at end of file
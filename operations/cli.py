@@ -1,12 +1,14 @@
 import sys
 import argparse
 from typing import Optional
+from logging_setup import configure_logging
 from hardware.mock_hardware import MockHardware
 from led_control.led_management import LEDManager
 from .interfaces.command_interface import CommandInterface
 from .interfaces.remote_interface import RemoteInterface
 
 def main():
+    configure_logging()
     parser = argparse.ArgumentParser(description='LED Operations CLI')
     parser.add_argument('--remote', action='store_true', help='Use remote hardware')
     parser.add_argument('--host', help='Remote hostname or IP')
@@ -37,10 +39,11 @@ def main():
             while True:
                 try:
                     command_line = input("> ").strip()
+                    keyword = command_line.lower()
                     
-                    if command_line.lower() == 'exit':
+                    if keyword == 'exit':
                         break
-                    elif command_line.lower() == 'help':
+                    elif keyword == 'help':
                         print(remote.command_interface.get_help())
                     else:
                         remote.execute_command(command_line)
@@ -66,10 +69,11 @@ def main():
         while True:
             try:
                 command_line = input("> ").strip()
+                keyword = command_line.lower()
                 
-                if command_line.lower() == 'exit':
+                if keyword == 'exit':
                     break
-                elif command_line.lower() == 'help':
+                elif keyword == 'help':
                     print(interface.get_help())
                 else:
                     interface.execute_command(command_line)
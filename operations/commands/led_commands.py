@@ -1,4 +1,6 @@
 from typing import List, Dict, Any
+from constants import MAX_BRIGHTNESS
+from led_control.led_management import FADE_CURVE
 from .base import Command
 
 class OnCommand(Command):
@@ -18,13 +20,13 @@ class OnCommand(Command):
             return False
             
         try:
-            for led_id in args:
-                led_id = int(led_id)
-                led_manager.set_led(led_id, 1.0)
-            return True
+            led_ids = [int(led_id) for led_id in args]
         except ValueError:
             print("Error: LED IDs must be numbers")
             return False
+        
+        led_manager.set_many(led_ids, MAX_BRIGHTNESS)
+        return True
 
 class OffCommand(Command):
     """Turn off one or more LEDs"""
@@ -43,13 +45,13 @@ class OffCommand(Command):
             return False
             
         try:
-            for led_id in args:
-                led_id = int(led_id)
-                led_manager.set_led(led_id, 0.0)
-            return True
+            led_ids = [int(led_id) for led_id in args]
         except ValueError:
             print("Error: LED IDs must be numbers")
             return False
+        
+        led_manager.set_many(led_ids, 0)
+        return True
 
 class FadeCommand(Command):
     """Fade one or more LEDs"""
@@ -68,19 +70,15 @@ class FadeCommand(Command):
             return False
             
         try:
-            for i in range(0, len(args), 2):
-                led_id = int(args[i])
-                duration = float(args[i + 1])
-                
-                # Fade in
-                led_manager.set_led(led_id, 0.0)
-                led_manager.set_led(led_id, 1.0)
-                # Fade out
-                led_manager.set_led(led_id, 0.0)
-            return True
+            fades = [(int(args[i]), float(args[i + 1])) for i in range(0, len(args), 2)]
         except (ValueError, IndexError):
             print("Error: Invalid arguments")
             return False
+        
+        # Fade in and back out over each duration (in seconds)
+        for led_id, duration in fades:
+            led_manager.schedule_brightness_curve(led_id, FADE_CURVE, duration)
+        return True
 
 class PatternCommand(Command):
     """Set a pattern of LEDs"""
@@ -1,4 +1,5 @@
-from typing import Dict, List, Any, Optional
+import shlex
+from typing import Callable, Dict, List, Any, Optional
 from ..commands.base import Command
 from ..commands.led_commands import OnCommand, OffCommand, FadeCommand, PatternCommand
 
@@ -7,6 +8,8 @@ class CommandInterface:
     
     def __init__(self):
         self.commands: Dict[str, Command] = {}
+        # Bound execute methods by command name, so dispatch is a single lookup
+        self._dispatch: Dict[str, Callable[[List[str], Dict[str, Any]], bool]] = {}
         self.context: Dict[str, Any] = {}
         self._register_default_commands()
     
@@ -19,7 +22,10 @@ class CommandInterface:
     
     def register_command(self, command: Command):
         """Register a new command"""
-        self.commands[command.name] = command
+        # Keyed by lowercase name so lookups only lowercase the typed word
+        name = command.name.lower()
+        self.commands[name] = command
+        self._dispatch[name] = command.execute
     
     def set_context(self, key: str, value: Any):
         """Set a value in the execution context"""
@@ -39,19 +45,29 @@ class CommandInterface:
         Returns:
             bool: True if command executed successfully
         """
-        parts = command_line.strip().split()
+        # Split off the command name; the arguments are only parsed for known commands
+        parts = command_line.split(None, 1)
         if not parts:
             return False
             
         command_name = parts[0].lower()
-        args = parts[1:]
         
-        command = self.commands.get(command_name)
-        if not command:
+        execute = self._dispatch.get(command_name)
+        if execute is None:
             print(f"Unknown command: {command_name}")
             return False
+        
+        tail = parts[1] if len(parts) > 1 else ""
+        if '"' in tail or "'" in tail:
+            try:
+                args = shlex.split(tail)
+            except ValueError as e:
+                print(f"Error: {e}")
+                return False
+        else:
+            args = tail.split()
             
-        return command.execute(args, self.context)
+        return execute(args, self.context)
     
     def get_help(self) -> str:
         """Get help text for all commands"""
@@ -3,6 +3,9 @@ import time
 from typing import Optional, Dict, Any
 from ..interfaces.command_interface import CommandInterface
 
+# Prompt printed by operations.cli when it is ready for the next command
+PROMPT = "> "
+
 class RemoteInterface:
     """Interface for remote hardware control via SSH"""
     
@@ -22,6 +25,9 @@ class RemoteInterface:
         self.key_filename = key_filename
         self.client: Optional[paramiko.SSHClient] = None
         self.command_interface: Optional[CommandInterface] = None
+        # Streams of the long-lived remote CLI process that runs every command
+        self._stdin: Optional[paramiko.ChannelFile] = None
+        self._stdout: Optional[paramiko.ChannelFile] = None
     
     def connect(self) -> bool:
         """
@@ -58,6 +64,14 @@ class RemoteInterface:
     
     def disconnect(self):
         """Disconnect from the remote server"""
+        if self._stdin:
+            try:
+                self._stdin.write("exit\n")
+                self._stdin.flush()
+                self._stdout.channel.close()
+            except Exception:
+                pass
+            self._stdin = self._stdout = None
         if self.client:
             self.client.close()
             self.client = None
@@ -86,6 +100,22 @@ interface = CommandInterface()
 interface.set_context('led_manager', led_manager)
 """
         self.client.exec_command(f"python3 -c '{setup_code}'")
+        
+        # Start one CLI process and keep it for every command, instead of
+        # paying interpreter startup and imports per command
+        self._stdin, self._stdout, _ = self.client.exec_command("python3 -u -m operations.cli")
+        self._read_until_prompt()
+    
+    def _read_until_prompt(self) -> str:
+        """Read remote CLI output up to its next prompt, returning the output without the prompt"""
+        channel = self._stdout.channel
+        output = b""
+        while not output.endswith(PROMPT.encode()):
+            data = channel.recv(4096)
+            if not data:
+                raise ConnectionError("Remote CLI exited")
+            output += data
+        return output[:-len(PROMPT)].decode()
     
     def execute_command(self, command_line: str) -> bool:
         """
@@ -97,21 +127,19 @@ interface.set_context('led_manager', led_manager)
         Returns:
             bool: True if command executed successfully
         """
-        if not self.client:
+        if not self.client or not self._stdin:
             print("Not connected to remote server")
             return False
             
         try:
-            # Execute the command on the remote
-            stdin, stdout, stderr = self.client.exec_command(f"python3 -c 'from operations.cli import main; main()'")
-            
-            # Send the command
-            stdin.write(f"{command_line}\n")
-            stdin.flush()
+            # Send the command to the running CLI
+            self._stdin.write(f"{command_line}\n")
+            self._stdin.flush()
             
             # Get the output
-            output = stdout.read().decode()
-            error = stderr.read().decode()
+            output = self._read_until_prompt()
+            channel = self._stdout.channel
+            error = channel.recv_stderr(4096).decode() if channel.recv_stderr_ready() else ""
             
             if error:
                 print(f"Error: {error}")
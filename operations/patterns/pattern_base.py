@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional
 import time
 import threading
+from functools import partial
+from led_control.led_management import scheduler
+from logging_setup import logger
 
 class Pattern(ABC):
     """Base class for all LED patterns"""
@@ -9,9 +12,16 @@ class Pattern(ABC):
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
-        self._running = False
         self._paused = False
-        self._thread = None
+        # Step generator being driven on the shared scheduler thread, and its next entry;
+        # the pattern is running exactly while _steps is set
+        self._steps: Optional[Iterator[float]] = None
+        self._entry: Optional[int] = None
+        self._deadline = 0.0
+        # Bumped on every start and stop; a step callback carries the token it was
+        # scheduled under, so one already popped off the heap can't advance a newer run
+        self._run = 0
+        self._step_lock = threading.Lock()
     
     @abstractmethod
     def execute(self, led_manager, args: List[str]) -> bool:
@@ -28,36 +38,81 @@ class Pattern(ABC):
         pass
     
     def stop(self):
-        """Stop the pattern"""
-        self._running = False
-        if self._thread:
-            self._thread.join()
-            self._thread = None
+        """Stop the pattern, running its cleanup before returning"""
+        with self._step_lock:
+            self._run += 1
+            if self._entry is not None:
+                scheduler.cancel(self._entry)
+                self._entry = None
+            if self._steps is not None:
+                # Raises GeneratorExit at the paused yield, so the pattern's finally runs
+                self._steps.close()
+                self._steps = None
     
     def pause(self):
-        """Pause the pattern"""
+        """Pause the pattern; its next step parks instead of running"""
         self._paused = True
     
     def resume(self):
-        """Resume the pattern"""
-        self._paused = False
+        """Resume the pattern, restarting a parked step on a fresh cadence"""
+        with self._step_lock:
+            self._paused = False
+            if self._steps is not None and self._entry is None:
+                self._deadline = time.monotonic()
+                self._entry = scheduler.schedule(self._deadline, partial(self._step, self._run))
     
     def is_running(self) -> bool:
         """Check if pattern is running"""
-        return self._running
+        return self._steps is not None
     
     def is_paused(self) -> bool:
         """Check if pattern is paused"""
         return self._paused
     
-    def _wait_if_paused(self):
-        """Wait if pattern is paused"""
-        while self._paused and self._running:
-            time.sleep(0.1)
-    
-    def _run_in_thread(self, func, *args, **kwargs):
-        """Run a function in a separate thread"""
-        self._running = True
-        self._thread = threading.Thread(target=func, args=args, kwargs=kwargs)
-        self._thread.daemon = True
-        self._thread.start() 
\ No newline at end of file
+    def _start(self, steps: Iterator[float]):
+        """
+        Run a pattern's step generator on the shared scheduler thread
+        
+        Each value the generator yields is the delay (in seconds) before its next
+        step. Deadlines accumulate from the start time, so the cadence doesn't
+        drift with the time spent in each step. All patterns share the one
+        scheduler thread instead of starting a thread each.
+        
+        Args:
+            steps: Generator that performs one step per next() call
+        """
+        self.stop()
+        with self._step_lock:
+            self._run += 1
+            self._steps = steps
+            self._deadline = time.monotonic()
+            self._entry = scheduler.schedule(self._deadline, partial(self._step, self._run))
+    
+    def _step(self, run: int):
+        """Advance the step generator and schedule its next step"""
+        with self._step_lock:
+            if run != self._run or self._steps is None:
+                return
+            if self._paused:
+                # Park without rescheduling; resume() schedules the next step, so a
+                # paused pattern costs nothing and step loops never check for pauses
+                self._entry = None
+                return
+            # The one handler for pattern errors, so step loops carry no try/except;
+            # a generator that raises has already run its finally cleanup
+            try:
+                delay = next(self._steps)
+                # A deadline moving backwards would keep this pattern first on the
+                # shared heap, starving every other scheduled task
+                if delay < 0:
+                    raise ValueError(f"Negative step delay: {delay}")
+            except Exception as e:
+                if not isinstance(e, StopIteration):
+                    logger.exception("Error in %s pattern", self.name)
+                # Runs the finally cleanup of a generator that is still suspended
+                self._steps.close()
+                self._steps = None
+                self._entry = None
+                return
+            self._deadline += delay
+            self._entry = scheduler.schedule(self._deadline, partial(self._step, run)) 
\ No newline at end of file
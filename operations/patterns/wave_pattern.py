@@ -1,7 +1,61 @@
-import time
-from typing import List
+from functools import lru_cache
+from typing import Iterator, List, Sequence, Tuple
+from constants import MAX_BRIGHTNESS, DEFAULT_COLS
 from .pattern_base import Pattern
 
+
+@lru_cache(maxsize=32)
+def _wave_order(num_leds: int, direction: str, cols: int = DEFAULT_COLS) -> Sequence[int]:
+    """
+    LED IDs in the order a wave visits them
+    
+    IDs are laid out row-major in rows of `cols` LEDs. The order is computed once
+    per strip size and direction, so the step loop never branches on direction.
+    """
+    if direction == "right":
+        return range(num_leds)
+    if direction == "left":
+        return range(num_leds - 1, -1, -1)
+    # up or down walk each column in turn, skipping cells past the end of a short last row
+    rows = -(-num_leds // cols)
+    row_order = range(rows) if direction == "down" else range(rows - 1, -1, -1)
+    return tuple(row * cols + col for col in range(cols) for row in row_order if row * cols + col < num_leds)
+
+
+def _render_wave(frame: bytearray, i: int, tail: int) -> int:
+    """
+    Render step i of a wave into frame, indexed by position along the wave
+    
+    Position i is fully on and the `tail` positions behind it fade out. Only the
+    positions that differ from step i - 1 are written, so frame[start:i + 1] is
+    all that needs pushing to the hardware.
+    
+    Returns:
+        start: First position written
+    """
+    start = max(0, i - tail - 1)
+    for j in range(start, i + 1):
+        distance = i - j
+        frame[j] = MAX_BRIGHTNESS * (tail + 1 - distance) // (tail + 1) if distance <= tail else 0
+    return start
+
+
+@lru_cache(maxsize=32)
+def _wave_sweep(num_leds: int, direction: str, tail: int) -> Tuple[Tuple[Sequence[int], bytes], ...]:
+    """
+    Every step of one sweep as the (LED IDs, levels) pair it pushes
+    
+    A sweep depends only on the strip size, direction and tail, so it is rendered
+    once per combination and a running wave just replays it.
+    """
+    order = _wave_order(num_leds, direction)
+    frame = bytearray(num_leds)
+    steps = []
+    for i in range(num_leds):
+        start = _render_wave(frame, i, tail)
+        steps.append((order[start:i + 1], bytes(frame[start:i + 1])))
+    return tuple(steps)
+
 class WavePattern(Pattern):
     """Wave pattern that moves across the LED matrix"""
     
@@ -14,7 +68,8 @@ class WavePattern(Pattern):
         
         Args:
             led_manager: LED manager instance
-            args: Pattern arguments [direction, speed]
+            args: Pattern arguments [direction, speed, tail], where tail is how
+                many LEDs fade out behind the lit one (default 0)
             
         Returns:
             bool: True if pattern started successfully
@@ -22,45 +77,52 @@ class WavePattern(Pattern):
         # Parse arguments
         direction = args[0] if args else 'right'
         speed = float(args[1]) if len(args) > 1 else 0.5
+        tail = max(0, int(args[2])) if len(args) > 2 else 0
         
         # Validate direction
         if direction not in ['left', 'right', 'up', 'down']:
             print(f"Invalid direction: {direction}")
             return False
         
+        # Validate speed; every step runs on the shared scheduler thread, so a
+        # zero delay would spin it
+        if speed <= 0:
+            print(f"Invalid speed: {speed}")
+            return False
+        
         # Start the pattern in a separate thread
-        self._run_in_thread(self._wave_effect, led_manager, direction, speed)
+        self._start(self._wave_steps(led_manager, direction, speed, tail))
         return True
     
-    def _wave_effect(self, led_manager, direction: str, speed: float):
-        """Run the wave effect"""
+    def _wave_steps(self, led_manager, direction: str, speed: float, tail: int = 0) -> Iterator[float]:
+        """
+        Run the wave effect, one step per next() call
+        
+        Yields the delay before the next step. The LED count is read once per
+        sweep, so LEDs added while the wave runs join at the start of the next sweep.
+        """
+        # Bound once so the step loop does no attribute lookups; this keeps it
+        # cheap on CPython and a tight, JIT-friendly trace under PyPy
+        set_levels = led_manager.set_levels
         try:
-            while self._running:
-                self._wait_if_paused()
-                
+            while True:
                 # Get the number of LEDs
                 num_leds = led_manager.num_leds
+                if not num_leds:
+                    yield speed
+                    continue
+                
+                # Each sweep starts from a dark strip, clearing the previous sweep's tail
+                led_manager.set_all(0)
                 
                 # Create wave effect
-                for i in range(num_leds):
-                    if not self._running:
-                        break
-                        
-                    self._wait_if_paused()
-                    
-                    # Turn off all LEDs
-                    for j in range(num_leds):
-                        led_manager.set_led(j, 0.0)
-                    
-                    # Turn on current LED
-                    led_manager.set_led(i, 1.0)
+                for led_ids, levels in _wave_sweep(num_leds, direction, tail):
+                    # Light the current LED and fade or clear the ones behind it in one write
+                    set_levels(led_ids, levels)
                     
                     # Wait for next step
-                    time.sleep(speed)
+                    yield speed
                 
-        except Exception as e:
-            print(f"Error in wave pattern: {e}")
         finally:
-            # Turn off all LEDs when done
-            for i in range(led_manager.num_leds):
-                led_manager.set_led(i, 0.0) 
\ No newline at end of file
+            # Turn off all LEDs when done, including after an error (Pattern._step logs it)
+            led_manager.set_all(0) 
\ No newline at end of file
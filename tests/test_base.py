@@ -1,17 +1,23 @@
 import unittest
-import time
-from led_control.led_management import LEDManager
+from unittest.mock import patch
+from led_control.led_management import LED, LEDManager
 from hardware.mock_hardware import MockHardware
 
 class BaseLEDTest(unittest.TestCase):
+    # LED IDs every test runs against, one subTest each; test_runner sets them from --leds
+    led_ids = [0]
+    
+    # When False, fades play their whole ramp at once so tests check the same
+    # levels without waiting; set True to watch fades at their real speed
+    realtime_fades = False
+    
     def setUp(self):
         self.hardware = MockHardware()
         self.led_manager = LEDManager(self.hardware)
         
     def tearDown(self):
-        # Turn off all LEDs after each test
-        for led_id in range(self.led_manager.num_leds):
-            self.led_manager.set_led(led_id, 0)
+        # Turn off all LEDs after each test, flushing each controller once
+        self.led_manager.set_all(0)
             
     def assert_led_state(self, led_id, expected_state):
         """Assert that an LED is in the expected state"""
@@ -20,30 +26,39 @@ class BaseLEDTest(unittest.TestCase):
         
     def fade_led(self, led_id, start_brightness, end_brightness, duration=1.0, steps=10):
         """Gradually change LED brightness over time"""
-        step_duration = duration / steps
+        # The whole ramp of 0-100 levels is built up front and played back on the
+        # manager's scheduler thread
         brightness_step = (end_brightness - start_brightness) / steps
+        levels = [int((start_brightness + brightness_step * i) * 100) for i in range(steps + 1)]
+        if not self.realtime_fades:
+            duration = 0.0
         
-        for i in range(steps + 1):
-            brightness = start_brightness + (brightness_step * i)
-            self.led_manager.set_led(led_id, brightness)
-            time.sleep(step_duration)
+        # Record every level the LED is set to, so the whole ramp is checked
+        with patch.object(LED, 'set_brightness', autospec=True, side_effect=LED.set_brightness) as set_brightness:
+            done = self.led_manager.schedule_brightness_curve(led_id, levels, duration)
+            self.assertTrue(done.wait(duration + 1.0))
+        self.assertEqual([call.args[1] for call in set_brightness.call_args_list], levels)
             
     def test_led_on_off(self):
-        """Test basic on/off functionality for an LED"""
-        # Test turning on
-        self.led_manager.set_led(self.led_id, 1.0)
-        self.assert_led_state(self.led_id, 1.0)
-        
-        # Test turning off
-        self.led_manager.set_led(self.led_id, 0.0)
-        self.assert_led_state(self.led_id, 0.0)
+        """Test basic on/off functionality for each LED"""
+        for led_id in self.led_ids:
+            with self.subTest(led=led_id):
+                # Test turning on
+                self.led_manager.set_led(led_id, 1.0)
+                self.assert_led_state(led_id, 1.0)
+                
+                # Test turning off
+                self.led_manager.set_led(led_id, 0.0)
+                self.assert_led_state(led_id, 0.0)
         
     def test_led_fade(self):
-        """Test fading functionality for an LED"""
-        # Test fade in
-        self.fade_led(self.led_id, 0.0, 1.0, duration=0.5)
-        self.assert_led_state(self.led_id, 1.0)
-        
-        # Test fade out
-        self.fade_led(self.led_id, 1.0, 0.0, duration=0.5)
-        self.assert_led_state(self.led_id, 0.0) 
\ No newline at end of file
+        """Test fading functionality for each LED"""
+        for led_id in self.led_ids:
+            with self.subTest(led=led_id):
+                # Test fade in
+                self.fade_led(led_id, 0.0, 1.0, duration=0.5)
+                self.assert_led_state(led_id, 1.0)
+                
+                # Test fade out
+                self.fade_led(led_id, 1.0, 0.0, duration=0.5)
+                self.assert_led_state(led_id, 0.0) 
\ No newline at end of file
@@ -0,0 +1,104 @@
+import unittest
+import time
+from functools import partial
+from hardware.mock_hardware import HardwareSystem
+from led_control.led_management import LEDMatrix
+from constants import TIME_UNIT
+
+class TestLEDMatrix(unittest.TestCase):
+    def setUp(self):
+        """Set up test environment before each test"""
+        self.controllers = HardwareSystem().get_controllers()
+        self.matrix = LEDMatrix(6, 9, self.controllers)
+
+    def test_row_and_column(self):
+        """Test row and column operations update LEDs and hardware"""
+        self.matrix.set_row(1, 50)
+        for col in range(9):
+            self.assertEqual(self.matrix.led_at(1, col).brightness, 50)
+        self.assertEqual(self.matrix.led_at(0, 0).brightness, 0)
+        self.assertEqual(self.controllers[0].channels[9].duty_cycle, 0xFFFF // 2)
+
+        self.matrix.set_column(2)
+        for row in range(6):
+            self.assertEqual(self.matrix.led_at(row, 2).brightness, 100)
+
+        self.matrix.all_off()
+        self.assertFalse(any(led.is_on() for led in self.matrix.leds))
+        self.assertEqual(self.controllers[0].channels[9].duty_cycle, 0)
+
+    def test_leds_use_their_own_controller(self):
+        """Test that LEDs past the first controller write to the right channel"""
+        self.matrix.leds[20].on(100)
+        self.assertEqual(self.controllers[1].channels[4].duty_cycle, 0xFFFF)
+        self.assertEqual(self.controllers[0].channels[4].duty_cycle, 0)
+
+    def test_set_pattern(self):
+        """Test that patterns are clamped and may be smaller than the matrix"""
+        self.matrix.set_pattern([[10, 20], [30, 150]])
+        self.assertEqual(self.matrix.led_at(0, 1).brightness, 20)
+        self.assertEqual(self.matrix.led_at(1, 1).brightness, 100)
+        self.assertEqual(self.matrix.led_at(2, 2).brightness, 0)
+
+    def test_float_brightness(self):
+        """Test that float brightness levels are accepted and truncated"""
+        self.matrix.leds[0].brightness = 50.5
+        self.assertEqual(self.matrix.leds[0].brightness, 50)
+        self.matrix.all_on(20.7)
+        self.assertEqual(self.matrix.led_at(5, 8).brightness, 20)
+        self.matrix.set_pattern([[10.9, 150.0]])
+        self.assertEqual(self.matrix.led_at(0, 0).brightness, 10)
+        self.assertEqual(self.matrix.led_at(0, 1).brightness, 100)
+
+class TestScheduling(unittest.TestCase):
+    def setUp(self):
+        """Set up test environment before each test"""
+        self.matrix = LEDMatrix(6, 9, HardwareSystem().get_controllers())
+
+    def test_scheduled_led_turns_on_and_restores(self):
+        """Test that a scheduled LED turns on and is restored afterwards"""
+        self.matrix.schedule_led(4, start_time=0, duration=1, brightness=60)
+        time.sleep(TIME_UNIT / 2)
+        self.assertEqual(self.matrix.leds[4].brightness, 60)
+        time.sleep(TIME_UNIT)
+        self.assertEqual(self.matrix.leds[4].brightness, 0)
+
+    def test_scheduled_float_brightness(self):
+        """Test that a scheduled float brightness is applied, not dropped on the scheduler thread"""
+        self.matrix.schedule_led(4, start_time=0, duration=1, brightness=55.5)
+        time.sleep(TIME_UNIT / 2)
+        self.assertEqual(self.matrix.leds[4].brightness, 55)
+    
+    def test_stale_callback_skips_reused_task(self):
+        """Test that a pooled task's old scheduler callback doesn't run its new task early"""
+        task_id = self.matrix.schedule_row(0, start_time=1, duration=1)
+        task = self.matrix._tasks_by_id[task_id]
+        # The on step the scheduler would run, captured before the task is recycled
+        stale = partial(task._execute_if_current, task_id)
+        self.assertTrue(self.matrix.cancel_task(task_id))
+        new_id = self.matrix.schedule_row(1, start_time=5, duration=1)
+        self.assertIs(self.matrix._tasks_by_id[new_id], task)
+        stale()
+        self.assertFalse(task.executed)
+        self.assertFalse(self.matrix.led_at(1, 0).is_on())
+    
+    def test_abort_blink_sequence(self):
+        """Test that aborting a blink sequence stops it and turns its LED off"""
+        self.matrix.blink_sequence(delay=1)
+        time.sleep(TIME_UNIT / 2)
+        self.assertTrue(self.matrix.leds[0].is_on())
+        self.matrix.abort()
+        time.sleep(TIME_UNIT * 1.5)
+        self.assertFalse(any(led.is_on() for led in self.matrix.leds))
+
+    def test_cancel_task(self):
+        """Test that a cancelled task never runs"""
+        task_id = self.matrix.schedule_row(0, start_time=1, duration=1)
+        self.assertEqual(self.matrix.get_scheduled_task_count(), 1)
+        self.assertTrue(self.matrix.cancel_task(task_id))
+        time.sleep(TIME_UNIT * 1.5)
+        self.assertFalse(self.matrix.leds[0].is_on())
+        self.assertFalse(self.matrix.cancel_task(task_id))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+from types import SimpleNamespace
+from led_control.patterns import LightingPattern
+
+ROWS, COLS = 3, 4
+
+def lit_cells(frame):
+    """Set of (row, col) cells lit in a frame"""
+    return {(row, col) for row, values in enumerate(frame) for col, level in enumerate(values) if level}
+
+def rows_lit(rows, cols=range(COLS)):
+    """Cells of whole rows"""
+    return {(row, col) for row in rows for col in cols}
+
+def cols_lit(cols):
+    """Cells of whole columns"""
+    return rows_lit(range(ROWS), cols)
+
+class TestPatternBuilders(unittest.TestCase):
+    def setUp(self):
+        """Set up a pattern on a small matrix that records what it schedules"""
+        self.scheduled = []
+        def schedule_patterns(patterns, start_times, durations, restore_original=True):
+            self.scheduled.append((patterns, start_times, durations, restore_original))
+            return list(range(len(patterns)))
+        self.matrix = SimpleNamespace(rows=ROWS, cols=COLS, schedule_patterns=schedule_patterns)
+        self.pattern = LightingPattern(self.matrix, "test")
+
+    def frames(self):
+        """Lit cells of each step, checking every step matches the matrix"""
+        for step in self.pattern.pattern_sequence:
+            self.assertEqual(len(step.pattern), ROWS)
+            self.assertEqual([len(row) for row in step.pattern], [COLS] * ROWS)
+        return [lit_cells(step.pattern) for step in self.pattern.pattern_sequence]
+
+    def test_row_and_column_steps(self):
+        """Test that row and column steps light exactly that row or column"""
+        self.pattern.add_row_step(1, 50, 2)
+        self.pattern.add_column_step(3, 150, 2)
+        self.assertEqual(self.frames(), [rows_lit([1]), cols_lit([3])])
+        self.assertEqual(self.pattern.pattern_sequence[1].pattern[0][3], 100)
+
+    def test_chase_pattern(self):
+        """Test that a chase sweeps one row or column at a time in each direction"""
+        expected = {
+            "right": [cols_lit([col]) for col in range(COLS)],
+            "left": [cols_lit([col]) for col in reversed(range(COLS))],
+            "down": [rows_lit([row]) for row in range(ROWS)],
+            "up": [rows_lit([row]) for row in reversed(range(ROWS))],
+        }
+        for direction, frames in expected.items():
+            with self.subTest(direction=direction):
+                self.pattern.clear_sequence()
+                self.pattern.add_chase_pattern(80, direction, 4)
+                self.assertEqual(self.frames(), frames)
+                self.assertEqual({step.duration for step in self.pattern.pattern_sequence}, {4})
+
+    def test_wave_pattern(self):
+        """Test that a wave band enters, crosses and leaves the matrix"""
+        expected = {
+            "right": [cols_lit(cols) for cols in ([0], [0, 1], [1, 2], [2, 3], [3])],
+            "left": [cols_lit(cols) for cols in ([3], [2, 3], [1, 2], [0, 1], [0])],
+            "down": [rows_lit(rows) for rows in ([0], [0, 1], [1, 2], [2])],
+            "up": [rows_lit(rows) for rows in ([2], [1, 2], [0, 1], [0])],
+        }
+        for direction, frames in expected.items():
+            with self.subTest(direction=direction):
+                self.pattern.clear_sequence()
+                self.pattern.add_wave_pattern(80, direction, 2)
+                self.assertEqual(self.frames(), frames)
+
+    def test_spiral_pattern(self):
+        """Test that a spiral visits every cell once, outside in"""
+        order = [(0, 0), (0, 1), (0, 2), (0, 3), (1, 3), (2, 3),
+                 (2, 2), (2, 1), (2, 0), (1, 0), (1, 1), (1, 2)]
+        self.pattern.add_spiral_pattern(60)
+        self.assertEqual(self.frames(), [{cell} for cell in order])
+
+        self.pattern.clear_sequence()
+        self.pattern.add_spiral_pattern(60, clockwise=False)
+        self.assertEqual(self.frames(), [{cell} for cell in reversed(order)])
+
+    def test_pulse_pattern(self):
+        """Test that a pulse fades every LED up and back down"""
+        self.pattern.add_pulse_pattern(100, 0, steps=3)
+        levels = []
+        for step in self.pattern.pattern_sequence:
+            self.assertEqual(len(set(b"".join(step.pattern))), 1)
+            levels.append(step.pattern[0][0])
+        self.assertEqual(levels, [0, 50, 100, 100, 50, 0])
+
+    def test_random_sparkle(self):
+        """Test that each sparkle step lights the requested number of LEDs"""
+        self.pattern.add_random_sparkle(max_active=3, steps=5)
+        frames = self.frames()
+        self.assertEqual(len(frames), 5)
+        self.assertEqual([len(cells) for cells in frames], [3] * 5)
+
+    def test_schedule_repetitions(self):
+        """Test that repetitions are scheduled back to back after the start delay"""
+        self.pattern.add_row_step(0, 100, 2)
+        self.pattern.add_column_step(1, 100, 3, transition_time=1)
+        row, column = (step.pattern for step in self.pattern.pattern_sequence)
+
+        task_ids = self.pattern.run_loop(2, start_delay=5)
+        self.assertEqual(task_ids, [0, 1, 2, 3])
+        patterns, start_times, durations, restore_original = self.scheduled[-1]
+        # Each repetition lasts 2 + (3 + 1) time units
+        self.assertEqual(list(zip(start_times, patterns)), [(5, row), (7, column), (11, row), (13, column)])
+        self.assertEqual(durations, [2, 3, 2, 3])
+        self.assertTrue(restore_original)
+
+        self.pattern.run_once()
+        self.assertEqual(self.scheduled[-1][1], [0, 2])
+        self.assertEqual(self.pattern.run_loop(0), [])
+        self.assertEqual(len(self.scheduled), 2)
+
+if __name__ == '__main__':
+    unittest.main()
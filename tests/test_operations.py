@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import patch
+from contextlib import redirect_stdout
 from io import StringIO
 from hardware.mock_hardware import MockHardware
 from led_control.led_management import LEDManager
@@ -46,14 +46,29 @@ class TestCommandInterface(unittest.TestCase):
         self.assertIn('pattern:', help_text)
 
 class TestLEDCommands(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Create one stdout capture buffer shared by every test"""
+        cls.out = StringIO()
+    
     def setUp(self):
         """Set up test environment before each test"""
         self.hardware = MockHardware()
         self.led_manager = LEDManager(self.hardware)
         self.context = {'led_manager': self.led_manager}
+        
+        # Capture stdout for the whole test in the shared buffer
+        self._drain()
+        redirect = redirect_stdout(self.out)
+        redirect.__enter__()
+        self.addCleanup(redirect.__exit__, None, None, None)
+    
+    def _drain(self):
+        """Empty the capture buffer"""
+        self.out.seek(0)
+        self.out.truncate()
     
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_on_command(self, mock_stdout):
+    def test_on_command(self):
         """Test the on command"""
         command = OnCommand()
         
@@ -64,17 +79,15 @@ class TestLEDCommands(unittest.TestCase):
         
         # Test invalid arguments
         self.assertFalse(command.execute([], self.context))
-        self.assertIn('Usage: on <led_id>', mock_stdout.getvalue())
+        self.assertIn('Usage: on <led_id>', self.out.getvalue())
         
         # Clear stdout
-        mock_stdout.truncate(0)
-        mock_stdout.seek(0)
+        self._drain()
         
         self.assertFalse(command.execute(['invalid'], self.context))
-        self.assertIn('Error: LED IDs must be numbers', mock_stdout.getvalue())
+        self.assertIn('Error: LED IDs must be numbers', self.out.getvalue())
     
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_off_command(self, mock_stdout):
+    def test_off_command(self):
         """Test the off command"""
         command = OffCommand()
         
@@ -89,17 +102,15 @@ class TestLEDCommands(unittest.TestCase):
         
         # Test invalid arguments
         self.assertFalse(command.execute([], self.context))
-        self.assertIn('Usage: off <led_id>', mock_stdout.getvalue())
+        self.assertIn('Usage: off <led_id>', self.out.getvalue())
         
         # Clear stdout
-        mock_stdout.truncate(0)
-        mock_stdout.seek(0)
+        self._drain()
         
         self.assertFalse(command.execute(['invalid'], self.context))
-        self.assertIn('Error: LED IDs must be numbers', mock_stdout.getvalue())
+        self.assertIn('Error: LED IDs must be numbers', self.out.getvalue())
     
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_fade_command(self, mock_stdout):
+    def test_fade_command(self):
         """Test the fade command"""
         command = FadeCommand()
         
@@ -108,38 +119,34 @@ class TestLEDCommands(unittest.TestCase):
         
         # Test invalid arguments
         self.assertFalse(command.execute([], self.context))
-        self.assertIn('Usage: fade <led_id>', mock_stdout.getvalue())
+        self.assertIn('Usage: fade <led_id>', self.out.getvalue())
         
         # Clear stdout
-        mock_stdout.truncate(0)
-        mock_stdout.seek(0)
+        self._drain()
         
         self.assertFalse(command.execute(['0'], self.context))
-        self.assertIn('Usage: fade <led_id>', mock_stdout.getvalue())
+        self.assertIn('Usage: fade <led_id>', self.out.getvalue())
         
         # Clear stdout
-        mock_stdout.truncate(0)
-        mock_stdout.seek(0)
+        self._drain()
         
         self.assertFalse(command.execute(['invalid', '0.5'], self.context))
-        self.assertIn('Error: Invalid arguments', mock_stdout.getvalue())
+        self.assertIn('Error: Invalid arguments', self.out.getvalue())
     
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_pattern_command(self, mock_stdout):
+    def test_pattern_command(self):
         """Test the pattern command"""
         command = PatternCommand()
         
         # Test valid command
         self.assertFalse(command.execute(['test_pattern'], self.context))
-        self.assertIn('Pattern \'test_pattern\' not implemented yet', mock_stdout.getvalue())
+        self.assertIn('Pattern \'test_pattern\' not implemented yet', self.out.getvalue())
         
         # Clear stdout
-        mock_stdout.truncate(0)
-        mock_stdout.seek(0)
+        self._drain()
         
         # Test invalid arguments
         self.assertFalse(command.execute([], self.context))
-        self.assertIn('Usage: pattern <pattern_name>', mock_stdout.getvalue())
+        self.assertIn('Usage: pattern <pattern_name>', self.out.getvalue())
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
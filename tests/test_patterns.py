@@ -0,0 +1,137 @@
+import unittest
+import time
+import threading
+from contextlib import redirect_stdout
+from io import StringIO
+from hardware.mock_hardware import MockHardware
+from led_control.led_management import LEDManager, scheduler
+from operations.patterns import Pattern, WavePattern
+from constants import TIME_UNIT
+
+NUM_LEDS = 6
+# Short step period so a test sees many steps without slowing the suite
+STEP = TIME_UNIT / 10
+
+def wait_until(predicate, timeout=1.0):
+    """Poll until predicate() is true, returning its last result"""
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(STEP / 10)
+    return predicate()
+
+class BackwardsPattern(Pattern):
+    """Pattern whose step asks to run before the one it just ran"""
+
+    def __init__(self):
+        super().__init__("backwards", "Yield a negative delay")
+        self.cleaned_up = threading.Event()
+
+    def execute(self, led_manager, args):
+        self._start(self._backwards_steps())
+        return True
+
+    def _backwards_steps(self):
+        try:
+            while True:
+                yield -1
+        finally:
+            self.cleaned_up.set()
+
+class TestWavePattern(unittest.TestCase):
+    def setUp(self):
+        """Set up test environment before each test"""
+        self.led_manager = LEDManager(MockHardware())
+        for led_id in range(NUM_LEDS):
+            self.led_manager.set_led(led_id, 0)
+        self.pattern = WavePattern()
+
+    def tearDown(self):
+        self.pattern.stop()
+
+    def lit(self):
+        """IDs of the LEDs currently on"""
+        return [led_id for led_id in range(NUM_LEDS) if self.led_manager.get_led_state(led_id) > 0]
+
+    def assert_all_off(self):
+        self.assertEqual([self.led_manager.get_led_state(led_id) for led_id in range(NUM_LEDS)], [0.0] * NUM_LEDS)
+
+    def test_run_lights_each_led(self):
+        """Test that a running wave lights every LED, one at a time"""
+        self.assertTrue(self.pattern.execute(self.led_manager, ['right', str(STEP)]))
+        self.assertTrue(self.pattern.is_running())
+        seen = set()
+        deadline = time.monotonic() + 1.0
+        while seen != set(range(NUM_LEDS)) and time.monotonic() < deadline:
+            lit = self.lit()
+            self.assertLessEqual(len(lit), 1)
+            seen.update(lit)
+            time.sleep(STEP / 10)
+        self.assertEqual(seen, set(range(NUM_LEDS)))
+
+    def test_pause_and_resume(self):
+        """Test that a paused wave holds its step and resumes from the next one"""
+        self.pattern.execute(self.led_manager, ['right', str(STEP)])
+        self.assertTrue(wait_until(lambda: len(self.lit()) == 1))
+        self.pattern.pause()
+        self.assertTrue(self.pattern.is_paused())
+        # Let a step already in flight land before taking the snapshot
+        time.sleep(STEP * 2)
+        paused = self.lit()
+        self.assertEqual(len(paused), 1)
+
+        time.sleep(STEP * 10)
+        self.assertEqual(self.lit(), paused)
+        self.assertTrue(self.pattern.is_running())
+
+        self.pattern.resume()
+        self.assertTrue(wait_until(lambda: len(self.lit()) == 1 and self.lit() != paused))
+        self.assertEqual(self.lit(), [(paused[0] + 1) % NUM_LEDS])
+
+    def test_stop_turns_leds_off(self):
+        """Test that stopping a wave leaves every LED off"""
+        self.pattern.execute(self.led_manager, ['left', str(STEP), '2'])
+        self.assertTrue(wait_until(lambda: len(self.lit()) > 1))
+        self.pattern.stop()
+        self.assertFalse(self.pattern.is_running())
+        self.assert_all_off()
+
+    def test_error_turns_leds_off(self):
+        """Test that a wave whose step raises ends and leaves every LED off"""
+        set_levels = self.led_manager.set_levels
+        calls = []
+        def failing_set_levels(led_ids, levels):
+            calls.append(led_ids)
+            if len(calls) > 3:
+                raise RuntimeError("write failed")
+            set_levels(led_ids, levels)
+        self.led_manager.set_levels = failing_set_levels
+
+        with self.assertLogs('logging_setup', 'ERROR') as logs:
+            self.pattern.execute(self.led_manager, ['right', str(STEP)])
+            self.assertTrue(wait_until(lambda: not self.pattern.is_running()))
+        self.assertIn("Error in wave pattern", logs.output[0])
+        self.assert_all_off()
+
+    def test_invalid_speed(self):
+        """Test that a zero or negative speed is rejected instead of started"""
+        for speed in ('0', '-1'):
+            with self.subTest(speed=speed):
+                with redirect_stdout(StringIO()):
+                    self.assertFalse(self.pattern.execute(self.led_manager, ['right', speed]))
+                self.assertFalse(self.pattern.is_running())
+
+    def test_negative_delay_ends_pattern(self):
+        """Test that a negative step delay ends the pattern without starving the scheduler"""
+        pattern = BackwardsPattern()
+        with self.assertLogs('logging_setup', 'ERROR') as logs:
+            pattern.execute(self.led_manager, [])
+            self.assertTrue(pattern.cleaned_up.wait(1.0))
+        self.assertIn("Error in backwards pattern", logs.output[0])
+        self.assertTrue(wait_until(lambda: not pattern.is_running()))
+
+        done = threading.Event()
+        scheduler.schedule(time.monotonic(), done.set)
+        self.assertTrue(done.wait(1.0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,11 +10,9 @@ class LEDTestRunner:
     def __init__(self):
         self.test_suite = unittest.TestSuite()
         
-    def add_test(self, test_class, test_name, led_id):
-        """Add a specific test to the test suite"""
-        test = test_class(test_name)
-        test.led_id = led_id
-        self.test_suite.addTest(test)
+    def add_test(self, test_class, test_name):
+        """Add a specific test to the test suite; it covers every LED in test_class.led_ids"""
+        self.test_suite.addTest(test_class(test_name))
         
     def run_tests(self):
         """Run all tests in the suite"""
@@ -38,12 +36,13 @@ def main():
         
     runner = LEDTestRunner()
     
-    for led_id in args.leds:
-        for test_name in args.tests:
-            if test_name == 'on_off':
-                runner.add_test(BaseLEDTest, 'test_led_on_off', led_id)
-            elif test_name == 'fade':
-                runner.add_test(BaseLEDTest, 'test_led_fade', led_id)
+    # One test case per test type, each looping over the LEDs as subtests
+    BaseLEDTest.led_ids = args.leds
+    for test_name in args.tests:
+        if test_name == 'on_off':
+            runner.add_test(BaseLEDTest, 'test_led_on_off')
+        elif test_name == 'fade':
+            runner.add_test(BaseLEDTest, 'test_led_fade')
                 
     runner.run_tests()
 